@@ -2,52 +2,226 @@
 
 import contextlib
 import collections
+import importlib
 import os
 import time
 
-from typing import Any, List, Tuple
+from typing import TYPE_CHECKING, Any, Iterator, List, Tuple
+
+from advent.mapped import MappedInput
+
+if TYPE_CHECKING:
+    from advent import cache
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
-Answer = collections.namedtuple("Answer", "value time")
+CACHE_PATH = os.path.join(ROOT, ".advent_cache.sqlite")
+
+Answer = collections.namedtuple("Answer", "value time cpu cached", defaults=(0.0, False))
 
 
 def solve(
-    day: int, fn_01: callable = None, fn_02: callable = None, source: str = "data"
+    day: int,
+    fn_01: callable = None,
+    fn_02: callable = None,
+    source: str = "data",
+    use_cache: bool = False,
+    prepare: callable = None,
+    stream: bool = False,
+    profile: str = None,
 ) -> Tuple[Any, Any]:
     """Solve the puzzle for the given day.
 
+    If a `prepare` function is given, it is called once with the puzzle input
+    and its result is passed to both solvers as the `prepared` keyword.
+
     Args:
         day (int): Day of the puzzle.
         fn_01 (callable): Solver for part 01.
         fn_02 (callable): Solver for part 02.
         source (str): Name of the data dir (eg, 'test').
+        use_cache (bool): Reuse answers cached for the same input and source.
+        prepare (callable): Parser shared by both solvers.
+        stream (bool): Pass the input as a memory-mapped iterable of lines.
+        profile (str): Profile each phase and write the results to this dir.
 
     Returns:
         tuple
     """
 
-    puzzle_input = get_puzzle_input(day, source)
+    input_hash = hash_puzzle_input(day, source) if use_cache else None
+
+    key_01 = get_cache_key(day, 1, fn_01, input_hash)
+    key_02 = get_cache_key(day, 2, fn_02, input_hash)
 
-    answer_01 = run("Part 01", fn_01, puzzle_input)
-    answer_02 = run("Part 02", fn_02, puzzle_input)
+    with open_puzzle_input(day, source, stream) as puzzle_input:
+        kwargs = {}
+
+        if prepare is not None and not is_cached(key_01, key_02):
+            with profile_phase(profile, f"day_{day:02d}_prepare"):
+                st = time.perf_counter()
+                kwargs["prepared"] = prepare(puzzle_input)
+                et = time.perf_counter()
+
+                print(f"Prepare: {'':16} in {et - st:.3f}s")
+
+        with profile_phase(profile, f"day_{day:02d}_part_01"):
+            answer_01 = run("Part 01", fn_01, puzzle_input, key=key_01, **kwargs)
+
+        with profile_phase(profile, f"day_{day:02d}_part_02"):
+            answer_02 = run("Part 02", fn_02, puzzle_input, key=key_02, **kwargs)
 
     return answer_01, answer_02
 
 
-def run(part: str, fn: callable, puzzle_input: List[str]) -> Answer:
-    st = time.time()
-    value = fn(puzzle_input)
-    et = time.time()
+def solve_part(
+    day: int, part: int, source: str = "data", use_cache: bool = False, stream: bool = False
+) -> Answer:
+    """Solve one part of the puzzle for the given day.
+
+    Nothing is printed, so this is safe to call from a worker process.
+
+    Args:
+        day (int): Day of the puzzle.
+        part (int): Part of the puzzle (1 or 2).
+        source (str): Name of the data dir (eg, 'test').
+        use_cache (bool): Reuse answers cached for the same input and source.
+        stream (bool): Pass the input as a memory-mapped iterable of lines.
+
+    Returns:
+        Answer
+    """
+
+    module = importlib.import_module(f"advent.day_{day:02d}")
+    fn = getattr(module, f"part_{part:02d}", None)
+    prepare = getattr(module, "prepare", None)
+
+    input_hash = hash_puzzle_input(day, source) if use_cache else None
+
+    key = get_cache_key(day, part, fn, input_hash)
 
-    answer = Answer(value, et - st)
+    with open_puzzle_input(day, source, stream) as puzzle_input:
+        kwargs = {}
 
-    if value is not None:
-        print(f"{part}: {answer.value:< 16} in {answer.time:.3f}s")
+        if prepare is not None and not is_cached(key):
+            kwargs["prepared"] = prepare(puzzle_input)
+
+        return run(f"Part {part:02d}", fn, puzzle_input, verbose=False, key=key, **kwargs)
+
+
+def run(
+    part: str,
+    fn: callable,
+    puzzle_input: List[str],
+    verbose: bool = True,
+    key: "cache.Key" = None,
+    **kwargs,
+) -> Answer:
+    cached = None
+
+    if key:
+        from advent import cache
+
+        cached = cache.lookup(CACHE_PATH, key)
+
+    if cached is not None:
+        answer = Answer(*cached, cached=True)
+    else:
+        st, sc = time.perf_counter(), time.process_time()
+        value = fn(puzzle_input, **kwargs)
+        et, ec = time.perf_counter(), time.process_time()
+
+        answer = Answer(value, et - st, ec - sc)
+
+        if key:
+            cache.store(CACHE_PATH, key, answer.value, answer.time, answer.cpu)
+
+    if verbose:
+        report(part, answer, cached=answer.cached)
 
     return answer
 
 
+def get_cache_key(day: int, part: int, fn: callable, input_hash: str) -> "cache.Key":
+    """Return the cache key for the given solver, or None if it isn't cached."""
+
+    if fn is None or input_hash is None:
+        return None
+
+    from advent import cache
+
+    return cache.make_key(day, part, fn, input_hash)
+
+
+def is_cached(*keys: "cache.Key") -> bool:
+    """Return True if there is a cached answer for all of the given keys."""
+
+    if not all(keys):
+        return False
+
+    from advent import cache
+
+    return all(cache.lookup(CACHE_PATH, key) for key in keys)
+
+
+def profile_phase(profile: str, name: str) -> contextlib.AbstractContextManager:
+    """Return a context that profiles the given phase into the profile dir, if one is set."""
+
+    if not profile:
+        return contextlib.nullcontext()
+
+    from advent import profiling
+
+    return profiling.phase(profile, name)
+
+
+def hash_puzzle_input(day: int, source: str = "data") -> str:
+    """Return the hash of the puzzle input for the given day, for its cache keys."""
+
+    from advent import cache
+
+    return cache.hash_file(get_puzzle_path(day, source))
+
+
+def clear_caches(module) -> None:
+    """Clear the memoized functions and methods in the given day module."""
+
+    if module is None:
+        return
+
+    for obj in list(vars(module).values()):
+        if hasattr(obj, "cache_clear"):
+            obj.cache_clear()
+        elif isinstance(obj, type) and obj.__module__ == module.__name__:
+            for attr in vars(obj).values():
+                if hasattr(attr, "cache_clear"):
+                    attr.cache_clear()
+
+
+def report(part: str, answer: Answer, cached: bool = False) -> None:
+    """Print the answer for the given part, if there is one."""
+
+    if answer.value is not None:
+        print(f"{part}: {answer.value:< 16} in {answer.time:.3f}s{' (cached)' if cached else ''}")
+
+
+def parse_days(values: List[str]) -> List[int]:
+    """Return the days given on the command line (eg, '1', '1,2', '1-5')."""
+
+    days = []
+
+    for day in values:
+        if "-" in day:
+            mn, mx = day.split("-")
+            days.extend(range(int(mn), int(mx) + 1))
+        elif "," in day:
+            days.extend((int(d) for d in day.split(",")))
+        else:
+            days.append(int(day))
+
+    return days
+
+
 def get_puzzle_input(day: int, source: str = "data") -> List[str]:
     """Return the puzzle input for the given day.
 
@@ -59,7 +233,40 @@ def get_puzzle_input(day: int, source: str = "data") -> List[str]:
         list[str]
     """
 
-    path = os.path.join(ROOT, source, f"day_{day:02d}.txt")
+    path = get_puzzle_path(day, source)
 
     with open(path, "r") as fp:
-        return [line.strip() for line in fp.readlines()]
+        return [line.strip() for line in fp]
+
+
+def map_puzzle_input(day: int, source: str = "data") -> MappedInput:
+    """Return the puzzle input for the given day as a memory-mapped file.
+
+    Iterating the result yields the stripped lines lazily; close it when done.
+
+    Args:
+        day (int): Day to get the puzzle inpurt for.
+        source (str): Name of the data dir (eg, 'test').
+
+    Returns:
+        MappedInput
+    """
+
+    return MappedInput(get_puzzle_path(day, source))
+
+
+@contextlib.contextmanager
+def open_puzzle_input(day: int, source: str = "data", stream: bool = False) -> Iterator[Any]:
+    """Open the puzzle input for the given day, memory-mapped if `stream` is True."""
+
+    if stream:
+        with map_puzzle_input(day, source) as puzzle_input:
+            yield puzzle_input
+    else:
+        yield get_puzzle_input(day, source)
+
+
+def get_puzzle_path(day: int, source: str = "data") -> str:
+    """Return the path to the puzzle input file for the given day."""
+
+    return os.path.join(ROOT, source, f"day_{day:02d}.txt")
@@ -1,9 +1,13 @@
 """Advent of Code 2023 entry script."""
 
 import argparse
+import concurrent.futures
 import importlib
+import os
 import time
 
+from typing import Dict, List, Tuple
+
 import advent
 
 
@@ -12,52 +16,94 @@ def main():
 
     parser = argparse.ArgumentParser()
     parser.add_argument("days", type=str, nargs="*")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Solve each (day, part) in a pool of this many worker processes. A single day is "
+            "solved in this process, and days with a JOBS setting use that many workers."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Solve every puzzle, even if its answer is cached.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Memory-map the input of days that can solve it as a stream of lines.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const=os.path.join(advent.ROOT, "profile"),
+        default=None,
+        help="Profile each phase of each day (implies --no-cache and --jobs 1).",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="Report how long each day's module took to import.",
+    )
 
     args = parser.parse_args()
 
     st = time.time()
 
     days = []
-    t01s = []
-    t02s = []
-
-    n = 0
+    import_times = {}
 
-    for day in args.days or ["1-25"]:
-        if "-" in day:
-            mn, mx = day.split("-")
-            days.extend(range(int(mn), int(mx) + 1))
-        elif "," in day:
-            days.extend((int(d) for d in day.split))
-        else:
-            days.append(int(day))
+    for day in advent.parse_days(args.days or ["1-25"]):
+        day_name = "advent.day_{:02d}".format(day)
 
-    for day in days:
-        day_name = "day_{:02d}".format(day)
+        it = time.perf_counter()
 
         try:
-            module = importlib.import_module(day_name, advent)
+            importlib.import_module(day_name)
         except ModuleNotFoundError as exc:
             print(str(exc))
             break
 
-        print(f"\nDay {day:02d}")
-        a01, a02 = advent.solve(
-            day, getattr(module, "part_01", None), getattr(module, "part_02", None)
-        )
+        import_times[day_name] = time.perf_counter() - it
 
-        if a01.value is not None:
-            t01s.append(a01.time)
+        days.append(day)
 
-        if a02.value is not None:
-            t02s.append(a02.time)
+    if args.import_time:
+        report_import_times(import_times)
 
-        n += 1
+    if args.profile:
+        answers = solve_serial(days, use_cache=False, stream=args.stream, profile=args.profile)
+    elif args.jobs > 1 and len(days) > 1:
+        answers = solve_parallel(days, args.jobs, use_cache=not args.no_cache, stream=args.stream)
+    else:
+        answers = solve_serial(
+            days, use_cache=not args.no_cache, stream=args.stream, jobs=args.jobs
+        )
 
     et = time.time()
 
+    t01s = [a01.time for a01, __ in answers.values() if a01.value is not None]
+    t02s = [a02.time for __, a02 in answers.values() if a02.value is not None]
+
+    # Cached answers report the CPU time of the run that cached them, so leave them out.
+    solved = [a for pair in answers.values() for a in pair if not a.cached]
+    cached = sum(a.cached for pair in answers.values() for a in pair)
+
+    cpu = sum(a.cpu for a in solved)
+
+    n = len(answers)
+
     if n > 1:
-        print(f"\nSolved {n} puzzles in {et - st:.3f} seconds.")
+        summary = f"{cpu:.3f} seconds of CPU time"
+
+        if cached:
+            summary += f", {cached} answers cached"
+
+        print(f"\nSolved {n} puzzles in {et - st:.3f} seconds ({summary}).")
         print(
             f"\tPart 01 min: {min(t01s):.3f}s max: {max(t01s):.3f}s average: {sum(t01s) / float(len(t01s)):.3f}s"
         )
@@ -66,5 +112,89 @@ def main():
         )
 
 
+def report_import_times(import_times: Dict[str, float]):
+    """Print the import time of each module, slowest first."""
+
+    print(f"{'import time':>12} | module")
+
+    for name, seconds in sorted(import_times.items(), key=lambda item: -item[1]):
+        print(f"{seconds * 1e6:>10.0f}us | {name}")
+
+    print(f"{sum(import_times.values()) * 1e6:>10.0f}us | total")
+
+
+def solve_serial(
+    days: List[int],
+    use_cache: bool = True,
+    stream: bool = False,
+    profile: str = None,
+    jobs: int = 1,
+) -> Dict[int, Tuple[advent.Answer, advent.Answer]]:
+    """Solve the puzzles for the given days one after another.
+
+    Days with a module-level JOBS setting are given `jobs`, so they can split
+    their own work across that many worker processes. The pool in
+    `solve_parallel` doesn't do this, so its workers don't start pools of their own.
+    """
+
+    result = {}
+
+    for day in days:
+        module = importlib.import_module(f"advent.day_{day:02d}")
+
+        if hasattr(module, "JOBS"):
+            module.JOBS = jobs
+
+        print(f"\nDay {day:02d}")
+        result[day] = advent.solve(
+            day,
+            getattr(module, "part_01", None),
+            getattr(module, "part_02", None),
+            use_cache=use_cache,
+            prepare=getattr(module, "prepare", None),
+            stream=stream and getattr(module, "STREAMING", False),
+            profile=profile,
+        )
+
+    return result
+
+
+def solve_parallel(
+    days: List[int], jobs: int, use_cache: bool = True, stream: bool = False
+) -> Dict[int, Tuple[advent.Answer, advent.Answer]]:
+    """Solve the puzzles for the given days in a pool of worker processes.
+
+    Each (day, part) is solved in its own task; answers are reported in order.
+    """
+
+    result = {}
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+
+        for day in days:
+            module = importlib.import_module(f"advent.day_{day:02d}")
+
+            kwargs = dict(
+                use_cache=use_cache, stream=stream and getattr(module, "STREAMING", False)
+            )
+
+            futures[day] = (
+                executor.submit(advent.solve_part, day, 1, **kwargs),
+                executor.submit(advent.solve_part, day, 2, **kwargs),
+            )
+
+        for day, (f01, f02) in futures.items():
+            a01, a02 = f01.result(), f02.result()
+
+            print(f"\nDay {day:02d}")
+            advent.report("Part 01", a01)
+            advent.report("Part 02", a02)
+
+            result[day] = a01, a02
+
+    return result
+
+
 if __name__ == "__main__":
     main()
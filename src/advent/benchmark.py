@@ -0,0 +1,305 @@
+"""Advent of Code 2023 benchmark script.
+
+Usage:
+    python -m advent.benchmark 1-25 --warmup 1 --repeat 10 --output bench.json
+
+    # Fit how each solver scales on synthetic inputs of 1x, 2x, 4x and 8x the
+    # official size, and flag solvers that scale worse than in a previous run.
+    python -m advent.benchmark 11 24 --scaling --size 1 --steps 4 --baseline old.json
+"""
+
+import argparse
+import importlib
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+
+from typing import Any, Dict, List, Tuple
+
+import advent
+import advent.generate
+
+
+def main():
+    """Benchmark the puzzles for the given days."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", type=str, nargs="*")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="Untimed runs per part.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Timed runs per part.")
+    parser.add_argument("-s", "--source", type=str, default="data", help="Name of the data dir.")
+    parser.add_argument("-o", "--output", type=str, default=None, help="Write the JSON here.")
+    parser.add_argument(
+        "--scaling", action="store_true", help="Fit the complexity on synthetic inputs."
+    )
+    parser.add_argument("--size", type=float, default=1, help="Smallest synthetic input scale.")
+    parser.add_argument("--steps", type=int, default=4, help="Number of doublings of the scale.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic inputs.")
+    parser.add_argument("--baseline", type=str, default=None, help="Scaling JSON to compare to.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed increase of the fitted exponent."
+    )
+
+    args = parser.parse_args()
+
+    if args.scaling:
+        return main_scaling(args)
+
+    results = []
+
+    for day in advent.parse_days(args.days or ["1-25"]):
+        try:
+            module = importlib.import_module(f"advent.day_{day:02d}")
+        except ModuleNotFoundError as exc:
+            print(str(exc), file=sys.stderr)
+            break
+
+        puzzle_input = advent.get_puzzle_input(day, args.source)
+
+        for part in (1, 2):
+            fn = getattr(module, f"part_{part:02d}", None)
+
+            if fn is None:
+                continue
+
+            result = benchmark(fn, puzzle_input, args.warmup, args.repeat)
+            result = dict(day=day, part=part, **result)
+
+            print(
+                f"Day {day:02d} Part {part:02d}: "
+                f"min {fmt(result['min_ns'])} "
+                f"median {fmt(result['median_ns'])} "
+                f"p95 {fmt(result['p95_ns'])} "
+                f"stddev {fmt(result['stddev_ns'])}",
+                file=sys.stderr,
+            )
+
+            results.append(result)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    write(report, args.output)
+
+
+def main_scaling(args: argparse.Namespace) -> int:
+    """Benchmark the solvers for the given days over synthetic inputs of doubling size."""
+
+    days = advent.parse_days(args.days) if args.days else advent.generate.days()
+    scales = [args.size * 2**i for i in range(args.steps)]
+
+    results = []
+    generated = set(advent.generate.days())
+
+    for day in days:
+        if day not in generated:
+            print(f"Day {day:02d}: no synthetic input generator", file=sys.stderr)
+            continue
+
+        module = importlib.import_module(f"advent.day_{day:02d}")
+
+        for part in (1, 2):
+            fn = getattr(module, f"part_{part:02d}", None)
+
+            if fn is None:
+                continue
+
+            result = scaling(fn, day, scales, args.seed, args.warmup, args.repeat)
+            result = dict(day=day, part=part, **result)
+
+            print(
+                f"Day {day:02d} Part {part:02d}: "
+                f"O(n^{result['exponent']:.2f}) "
+                f"from {fmt(result['min_ns'][0])} to {fmt(result['min_ns'][-1])}",
+                file=sys.stderr,
+            )
+
+            results.append(result)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "scaling": results,
+    }
+
+    write(report, args.output)
+
+    if args.baseline:
+        with open(args.baseline, "r") as fp:
+            baseline = json.load(fp)
+
+        regressions = compare(results, baseline["scaling"], args.tolerance)
+
+        for day, part, old, new in regressions:
+            print(
+                f"Day {day:02d} Part {part:02d}: exponent grew from {old:.2f} to {new:.2f}",
+                file=sys.stderr,
+            )
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+def benchmark(fn: callable, puzzle_input: List[str], warmup: int, repeat: int) -> Dict[str, Any]:
+    """Time the given solver over the puzzle input.
+
+    Memoized state in the solver's module is cleared before every run, so
+    each sample measures a cold solve.
+
+    Args:
+        fn (callable): Solver for one part of a puzzle.
+        puzzle_input (list[str]): Puzzle input to solve.
+        warmup (int): Number of untimed runs.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict
+    """
+
+    module = sys.modules.get(fn.__module__)
+
+    for __ in range(warmup):
+        advent.clear_caches(module)
+        fn(puzzle_input)
+
+    samples = []
+    value = None
+
+    for __ in range(max(repeat, 1)):
+        advent.clear_caches(module)
+
+        st = time.perf_counter_ns()
+        value = fn(puzzle_input)
+        et = time.perf_counter_ns()
+
+        samples.append(et - st)
+
+    result = summarize(samples)
+    result["value"] = value
+
+    return result
+
+
+def scaling(
+    fn: callable, day: int, scales: List[float], seed: int, warmup: int, repeat: int
+) -> Dict[str, Any]:
+    """Time the given solver on synthetic inputs of each scale, and fit its complexity.
+
+    The exponent is the slope of log(time) over log(scale), where the scale is
+    the input size relative to an official input (the area, for grid puzzles).
+
+    Args:
+        fn (callable): Solver for one part of a puzzle.
+        day (int): Day of the puzzle.
+        scales (list[float]): Scales of the synthetic inputs.
+        seed (int): Seed for the synthetic inputs.
+        warmup (int): Number of untimed runs per scale.
+        repeat (int): Number of timed runs per scale.
+
+    Returns:
+        dict
+    """
+
+    times = []
+
+    for scale in scales:
+        puzzle_input = advent.generate.generate(day, scale, seed)
+        times.append(benchmark(fn, puzzle_input, warmup, repeat)["min_ns"])
+
+    return {
+        "scales": scales,
+        "min_ns": times,
+        "exponent": fit_exponent(scales, times),
+    }
+
+
+def fit_exponent(xs: List[float], ys: List[float]) -> float:
+    """Return the least squares slope of log(y) over log(x)."""
+
+    lx = [math.log(x) for x in xs]
+    ly = [math.log(max(y, 1)) for y in ys]
+
+    mx = statistics.mean(lx)
+    my = statistics.mean(ly)
+
+    num = sum((x - mx) * (y - my) for x, y in zip(lx, ly))
+    den = sum((x - mx) ** 2 for x in lx)
+
+    return num / den if den else 0.0
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float
+) -> List[Tuple[int, int, float, float]]:
+    """Return the (day, part, old, new) exponents of solvers that scale worse than the baseline."""
+
+    old = {(r["day"], r["part"]): r["exponent"] for r in baseline}
+
+    result = []
+
+    for r in results:
+        key = r["day"], r["part"]
+
+        if key in old and r["exponent"] > old[key] + tolerance:
+            result.append((r["day"], r["part"], old[key], r["exponent"]))
+
+    return result
+
+
+def summarize(samples: List[int]) -> Dict[str, Any]:
+    """Return the summary statistics of the given samples (in nanoseconds)."""
+
+    samples = sorted(samples)
+
+    return {
+        "samples": len(samples),
+        "min_ns": samples[0],
+        "median_ns": statistics.median(samples),
+        "p95_ns": percentile(samples, 95),
+        "stddev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def percentile(samples: List[int], p: float) -> int:
+    """Return the p-th percentile of the sorted samples (nearest rank)."""
+
+    rank = math.ceil(p / 100.0 * len(samples))
+
+    return samples[max(rank, 1) - 1]
+
+
+def write(report: Dict[str, Any], path: str = None) -> None:
+    """Write the report as JSON to the given path, or to stdout."""
+
+    text = json.dumps(report, indent=2, default=str)
+
+    if path:
+        with open(path, "w") as fp:
+            fp.write(text + "\n")
+    else:
+        print(text)
+
+
+def fmt(ns: float) -> str:
+    """Format the given duration in nanoseconds."""
+
+    if ns >= 1e9:
+        return f"{ns / 1e9:8.3f}s "
+    elif ns >= 1e6:
+        return f"{ns / 1e6:8.3f}ms"
+    else:
+        return f"{ns / 1e3:8.3f}us"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Persistent cache of puzzle answers.
+
+Answers are keyed on the SHA-256 of the puzzle input file and of the
+source file of the solver's module, so editing either invalidates them.
+"""
+
+import collections
+import contextlib
+import hashlib
+import inspect
+import json
+import sqlite3
+
+from typing import Any, Iterator, Optional, Tuple
+
+Key = collections.namedtuple("Key", "day part name input_hash source_hash")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    value TEXT,
+    time REAL NOT NULL,
+    cpu REAL NOT NULL,
+    PRIMARY KEY (day, part, name, input_hash, source_hash)
+)
+"""
+
+
+def make_key(day: int, part: int, fn: callable, input_hash: str) -> Optional[Key]:
+    """Return the cache key for the given solver, or None if it can't be cached.
+
+    Args:
+        day (int): Day of the puzzle.
+        part (int): Part of the puzzle (1 or 2).
+        fn (callable): Solver for the part.
+        input_hash (str): Hash of the puzzle input file.
+
+    Returns:
+        Key
+    """
+
+    source_hash = hash_source(fn)
+
+    if source_hash is None:
+        return None
+
+    return Key(day, part, fn.__qualname__, input_hash, source_hash)
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 of the given file."""
+
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 16), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def hash_source(fn: callable) -> Optional[str]:
+    """Return the SHA-256 of the source file of the given function, if it has one."""
+
+    try:
+        path = inspect.getsourcefile(fn)
+    except TypeError:
+        return None
+
+    if path is None:
+        return None
+
+    return hash_file(path)
+
+
+def lookup(path: str, key: Key) -> Optional[Tuple[Any, float, float]]:
+    """Return the cached (value, time, cpu) for the given key, if there is one."""
+
+    with connect(path) as db:
+        row = db.execute(
+            "SELECT value, time, cpu FROM answers WHERE "
+            "day = ? AND part = ? AND name = ? AND input_hash = ? AND source_hash = ?",
+            tuple(key),
+        ).fetchone()
+
+    if row is None:
+        return None
+
+    value, time, cpu = row
+
+    return json.loads(value), time, cpu
+
+
+def store(path: str, key: Key, value: Any, time: float, cpu: float) -> bool:
+    """Cache the answer for the given key.
+
+    Returns False if the value can't be stored (ie, it isn't JSON serializable).
+    """
+
+    try:
+        value = json.dumps(value)
+    except TypeError:
+        return False
+
+    with connect(path) as db:
+        db.execute(
+            "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            tuple(key) + (value, time, cpu),
+        )
+
+    return True
+
+
+@contextlib.contextmanager
+def connect(path: str) -> Iterator[sqlite3.Connection]:
+    """Open a transaction on the cache database, creating it if needed."""
+
+    db = sqlite3.connect(path, timeout=30)
+
+    try:
+        with db:
+            db.execute(SCHEMA)
+            yield db
+    finally:
+        db.close()
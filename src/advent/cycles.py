@@ -0,0 +1,126 @@
+"""Cycle detection, and combination of periodic streams.
+
+`brent` finds where a sequence of states starts repeating, given only the
+function that steps from one state to the next, in constant memory. States
+are compared by their fingerprint, so a large state can be reduced to a
+hash instead of being kept around.
+"""
+
+import functools
+import math
+
+from typing import Any, Callable, Iterable, Tuple
+
+State = Any
+Step = Callable[[State], State]
+Fingerprint = Callable[[State], Any]
+Same = Callable[[State, State], bool]
+
+
+def brent(
+    step: Step, start: State, fingerprint: Fingerprint = None, same: Same = None
+) -> Tuple[int, int]:
+    """Return (mu, lam): the index of the first state in the cycle, and the cycle length.
+
+    Args:
+        step (callable): Function that returns the state after the given state.
+        start (object): First state of the sequence.
+        fingerprint (callable): Function that returns a hashable summary of a
+            state; states with different fingerprints are assumed to differ.
+        same (callable): Function that returns True if two states with the
+            same fingerprint are really equal, to rule out hash collisions.
+            Without it, equal fingerprints are trusted.
+
+    Returns:
+        tuple[int, int]
+    """
+
+    f = fingerprint or identity
+
+    def equal(a: State, fa: Any, b: State, fb: Any) -> bool:
+        return fa == fb and (same is None or same(a, b))
+
+    # Find the cycle length, by moving the tortoise to the hare at each power of two.
+    power = lam = 1
+    tortoise = start
+    hare = step(start)
+
+    ft, fh = f(tortoise), f(hare)
+
+    while not equal(tortoise, ft, hare, fh):
+        if power == lam:
+            tortoise, ft = hare, fh
+            power *= 2
+            lam = 0
+
+        hare = step(hare)
+        fh = f(hare)
+        lam += 1
+
+    # Find the start of the cycle, with the hare lam steps ahead of the tortoise.
+    tortoise = hare = start
+
+    for __ in range(lam):
+        hare = step(hare)
+
+    mu = 0
+
+    while not equal(tortoise, f(tortoise), hare, f(hare)):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        mu += 1
+
+    return mu, lam
+
+
+def nth(
+    step: Step, start: State, n: int, fingerprint: Fingerprint = None, same: Same = None
+) -> State:
+    """Return the state after n steps from the start, skipping whole cycles."""
+
+    mu, lam = brent(step, start, fingerprint, same)
+
+    if n > mu:
+        n = mu + (n - mu) % lam
+
+    state = start
+
+    for __ in range(n):
+        state = step(state)
+
+    return state
+
+
+def lcm(*periods: int) -> int:
+    """Return the least common multiple of the given periods."""
+
+    return functools.reduce(lambda a, b: a * b // math.gcd(a, b), periods, 1)
+
+
+def crt(residues: Iterable[int], moduli: Iterable[int]) -> Tuple[int, int]:
+    """Return (x, m) such that x = r (mod n) for every residue r and modulus n, with m their lcm.
+
+    The moduli don't need to be coprime. Raises ValueError if the congruences
+    have no common solution.
+    """
+
+    x, m = 0, 1
+
+    for r, n in zip(residues, moduli):
+        g = math.gcd(m, n)
+
+        if (r - x) % g:
+            raise ValueError(f"No solution for x = {x} (mod {m}) and x = {r} (mod {n})")
+
+        # Step x by multiples of m until it also matches r (mod n).
+        k = ((r - x) // g) * pow(m // g, -1, n // g) % (n // g)
+
+        x += m * k
+        m = m * n // g
+        x %= m
+
+    return x, m
+
+
+def identity(state: State) -> State:
+    return state
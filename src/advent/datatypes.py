@@ -1,15 +1,23 @@
 """Common data types used in puzzles."""
 
 from __future__ import annotations
-from typing import ForwardRef, Iterator
+from typing import ForwardRef, Iterable, Iterator, List, Set, Tuple
 
 import collections
 
 Point = ForwardRef("Point")
+Point3 = ForwardRef("Point3")
+Grid = ForwardRef("Grid")
 
 
 class Point(collections.namedtuple("Point", "x y")):
-    """2D point in a grid."""
+    """2D point in a grid.
+
+    Points hash as plain tuples; tuple.__hash__ runs in C, and is faster than
+    any packed-int __hash__ written in Python.
+    """
+
+    __slots__ = ()
 
     def __str__(self) -> str:
         return f"<{self.x},{self.y}>"
@@ -18,10 +26,14 @@ class Point(collections.namedtuple("Point", "x y")):
         return str(self)
 
     def __add__(self, other: Point) -> Point:
-        if not isinstance(other, Point):
-            raise TypeError()
+        x, y = other
+
+        return Point(self[0] + x, self[1] + y)
 
-        return Point(self.x + other.x, self.y + other.y)
+    def __sub__(self, other: Point) -> Point:
+        x, y = other
+
+        return Point(self[0] - x, self[1] - y)
 
     def adjacent(self) -> Iterator[Point]:
         """Yield the points adjacent to this one in a grid."""
@@ -44,3 +56,175 @@ class Point(collections.namedtuple("Point", "x y")):
         yield Point(self.x + 1, self.y - 1)
         yield Point(self.x + 0, self.y - 1)
         yield Point(self.x - 1, self.y - 1)
+
+
+class Point3(collections.namedtuple("Point3", "x y z")):
+    """3D point in a grid."""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return f"<{self.x},{self.y},{self.z}>"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __add__(self, other: Point3) -> Point3:
+        x, y, z = other
+
+        return Point3(self[0] + x, self[1] + y, self[2] + z)
+
+    def __sub__(self, other: Point3) -> Point3:
+        x, y, z = other
+
+        return Point3(self[0] - x, self[1] - y, self[2] - z)
+
+    def adjacent(self) -> Iterator[Point3]:
+        """Yield the points adjacent to this one in a grid."""
+
+        x, y, z = self
+
+        yield Point3(x + 1, y, z)
+        yield Point3(x - 1, y, z)
+        yield Point3(x, y + 1, z)
+        yield Point3(x, y - 1, z)
+        yield Point3(x, y, z + 1)
+        yield Point3(x, y, z - 1)
+
+
+ADJACENT = (Point(+1, +0), Point(-1, +0), Point(+0, +1), Point(+0, -1))
+
+
+def encode(p: Point, width: int) -> int:
+    """Return the given point of a grid of the given width as an int.
+
+    Rows are laid out with one spare column, so stepping off the left or
+    right edge of a row lands on an id that no cell in the grid has, instead
+    of wrapping around to the next row.
+    """
+
+    return p.y * (width + 1) + p.x
+
+
+def decode(i: int, width: int) -> Point:
+    """Return the point encoded as the given int."""
+
+    y, x = divmod(i, width + 1)
+
+    return Point(x, y)
+
+
+def adjacent_offsets(width: int) -> Tuple[int, ...]:
+    """Return the offsets from an encoded point to its adjacent points, in ADJACENT order."""
+
+    stride = width + 1
+
+    return tuple(dy * stride + dx for dx, dy in ADJACENT)
+
+
+def adjacent_many_ids(ids: Iterable[int], width: int) -> Set[int]:
+    """Return the encoded points adjacent to any of the given encoded points."""
+
+    offsets = adjacent_offsets(width)
+
+    return {i + o for i in ids for o in offsets}
+
+
+class Grid(object):
+    """2D grid of byte-sized cells, stored row by row in a flat bytearray.
+
+    Cells are addressed by their index (y * width + x), so a search can keep
+    plain ints in its queues and visited sets instead of allocating a Point
+    for every neighbor.
+    """
+
+    __slots__ = ("cells", "width", "height")
+
+    def __init__(self, cells: bytearray, width: int, height: int):
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+
+        self.cells = cells
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], table: bytes = None) -> Grid:
+        """Return the grid of the given lines, with its cells mapped through `table` if given.
+
+        Args:
+            lines (iterable[str]): Rows of the grid, all of the same width.
+            table (bytes): Translation table (see bytes.maketrans) to apply to each cell.
+
+        Returns:
+            Grid
+        """
+
+        cells = bytearray()
+        width = None
+        height = 0
+
+        for line in lines:
+            row = line.encode("ascii")
+
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"Row {height} has width {len(row)}, expected {width}")
+
+            cells += row
+            height += 1
+
+        if table is not None:
+            cells = cells.translate(table)
+
+        return cls(cells, width or 0, height)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int):
+        self.cells[i] = value
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def copy(self) -> Grid:
+        """Return a copy of this grid."""
+
+        return Grid(bytearray(self.cells), self.width, self.height)
+
+    def lines(self) -> List[str]:
+        """Return the rows of this grid as strings."""
+
+        w = self.width
+
+        return [self.cells[i : i + w].decode("ascii") for i in range(0, len(self.cells), w)]
+
+    def index(self, x: int, y: int) -> int:
+        """Return the index of the cell at (x, y)."""
+
+        return y * self.width + x
+
+    def point(self, i: int) -> Point:
+        """Return the position of the cell at index i."""
+
+        y, x = divmod(i, self.width)
+
+        return Point(x, y)
+
+    def get(self, x: int, y: int, default: int = None) -> int:
+        """Return the cell at (x, y), or the default if it is out of bounds."""
+
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+
+        return default
+
+    def find(self, value: int) -> int:
+        """Return the index of the first cell with the given value, or -1."""
+
+        return self.cells.find(value)
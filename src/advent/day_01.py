@@ -5,6 +5,8 @@ from typing import List
 import functools
 import re
 
+STREAMING = True
+
 NUMBERS = {
     0: "zero",
     1: "one",
@@ -11,6 +11,8 @@ Cubes = collections.namedtuple("Draw", "red blue green")
 
 CUBES = Cubes(red=12, blue=14, green=13)
 
+STREAMING = True
+
 
 def part_01(puzzle_input):
     """Solve part one."""
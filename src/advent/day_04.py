@@ -5,6 +5,8 @@ import operator
 
 from typing import List
 
+STREAMING = True
+
 
 class Card(object):
     """Lottory scratch card."""
@@ -74,12 +74,15 @@ class MapRangesList(object):
             return n
 
 
-def part_01(puzzle_input: List[str]) -> int:
+Prepared = Tuple[List[int], Dict[str, MapRangesList]]
+
+
+def part_01(puzzle_input: List[str], prepared: Prepared = None) -> int:
     """Solve part one."""
 
     result = sys.maxsize
 
-    seeds, almanac = get_data(puzzle_input)
+    seeds, almanac = get_data(puzzle_input) if prepared is None else prepared
 
     src_ranges = [Range(s, s) for s in seeds]
     src_ranges.sort(key=operator.attrgetter("start"))
@@ -101,12 +104,12 @@ def walk(value, keys, almanac):
         return list(values)
 
 
-def part_02(puzzle_input):
+def part_02(puzzle_input, prepared: Prepared = None):
     """Solve part two."""
 
     result = sys.maxsize
 
-    seeds, almanac = get_data(puzzle_input)
+    seeds, almanac = get_data(puzzle_input) if prepared is None else prepared
 
     src_ranges = [Range(s, s + e) for s, e in zip(seeds[::2], seeds[1::2])]
     src_ranges.sort(key=operator.attrgetter("start"))
@@ -194,6 +197,12 @@ def remap(src_ranges: List[Range], map_ranges: List[MapRange]) -> List[Range]:
     return dst_ranges
 
 
+def prepare(puzzle_input: List[str]) -> Prepared:
+    """Return the seeds and the almanac."""
+
+    return get_data(puzzle_input)
+
+
 def get_data(puzzle_input) -> Tuple[List[str], Dict[str, MapRangesList]]:
     data = parse(puzzle_input)
     seeds = data.pop("seeds")
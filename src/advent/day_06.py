@@ -4,6 +4,8 @@ import sys
 
 from typing import Dict, List, Tuple
 
+from advent import parsing
+
 
 def part_01(puzzle_input: List[str]) -> int:
     """Solve part one."""
@@ -58,7 +60,7 @@ def parse_02(puzzle_input: List[str]) -> Dict[int, int]:
 def parse_line_01(line: str) -> List[int]:
     __, values = line.split(":")
 
-    return list(map(int, values.strip().split()))
+    return parsing.ints(values)
 
 
 def parse_line_02(line: str) -> int:
@@ -21,6 +21,8 @@ class Hands(enum.Enum):
 CARDS_01 = "AKQJT98765432"[::-1]
 CARDS_02 = "AKQT98765432J"[::-1]
 
+STREAMING = True
+
 Hand = collections.namedtuple("Hand", "cards bid rank", defaults=("", -1, -1))
 
 
@@ -2,11 +2,12 @@
 
 import collections
 import itertools
-import math
 import re
 
 from typing import Dict, List, Tuple
 
+from advent import cycles
+
 
 def part_01(puzzle_input: List[str]) -> int:
     """Solve part one."""
@@ -36,46 +37,73 @@ def part_01(puzzle_input: List[str]) -> int:
 def part_02(puzzle_input: List[str]) -> int:
     """Solve part two."""
 
-    result = 0
-
     turns, tree = parse(puzzle_input)
 
     starts = [each for each in tree if each.endswith("A")]
-    ends = [each for each in tree if each.endswith("Z")]
 
-    old_nodes = [None] * len(starts)
-    new_nodes = starts[:]
+    step = stepper(turns, tree)
 
-    turns = itertools.cycle(turns)
-    turn = next(turns)
+    streams = [find_ends(step, (start, 0)) for start in starts]
 
-    at_end = [0] * len(starts)
+    # Each stream is at an end at step t if t = hit (mod period), once its cycle has begun.
+    lo = max(max(mu, 1) for mu, __, __ in streams)
+    periods = [lam for __, lam, __ in streams]
 
-    while True:
-        result += 1
-        old_nodes, new_nodes = next_02(tree, turn, old_nodes, new_nodes)
+    # Before every cycle has begun, check the steps directly.
+    states = [(start, 0) for start in starts]
 
-        for i, node in enumerate(new_nodes):
-            if node in ends:
-                at_end[i] = result
+    for t in range(1, lo):
+        states = [step(state) for state in states]
 
-        if all(at_end):
-            break
+        if all(node.endswith("Z") for node, __ in states):
+            return t
 
-        turn = next(turns)
+    result = None
 
-    (gcd,) = {math.gcd(a, b) for a, b in itertools.combinations(at_end, 2)}
-    factors = [end // gcd for end in at_end]
+    for hits in itertools.product(*(hits for __, __, hits in streams)):
+        try:
+            x, m = cycles.crt(hits, periods)
+        except ValueError:
+            continue
 
-    return gcd * math.prod(factors)
+        if x < lo:
+            x += -((x - lo) // m) * m
 
+        result = x if result is None else min(result, x)
 
-def next_02(tree: Dict, turn: str, old_nodes: List[str], new_nodes: List[str]) -> List[str]:
-    for i, old in enumerate(new_nodes):
-        new = tree[old][turn]
-        old_nodes[i], new_nodes[i] = old, new
+    if result is None:
+        raise ValueError("The ghosts are never all at an end node at once")
+
+    return result
+
+
+def stepper(turns: str, tree: Dict) -> callable:
+    """Return the function that steps a (node, turn index) state once."""
+
+    def step(state: Tuple[str, int]) -> Tuple[str, int]:
+        node, i = state
+        return tree[node][turns[i]], (i + 1) % len(turns)
+
+    return step
+
+
+def find_ends(step: callable, state: Tuple[str, int]) -> Tuple[int, int, List[int]]:
+    """Return the start and length of the cycle of a stream, and the steps in it at an end node."""
+
+    mu, lam = cycles.brent(step, state)
+
+    for __ in range(mu):
+        state = step(state)
+
+    hits = []
+
+    for t in range(mu, mu + lam):
+        if state[0].endswith("Z"):
+            hits.append(t)
+
+        state = step(state)
 
-    return old_nodes, new_nodes
+    return mu, lam, hits
 
 
 def parse(puzzle_input: List[str]) -> Tuple[List[str], Dict]:
@@ -3,34 +3,45 @@
 import collections
 import itertools
 
-from typing import List
+from typing import Iterable, Iterator, List
 
+from advent import parsing
 
-def part_01(puzzle_input: List[str]) -> int:
-    """Solve part one."""
+STREAMING = True
 
-    sequences = parse(puzzle_input)
 
-    results = map(extrapolate, sequences)
+def part_01(puzzle_input: List[str]) -> int:
+    """Solve part one."""
 
-    return sum(results)
+    return sum(extrapolate_all(values) for values in parsing.int_chunks(puzzle_input))
 
 
 def part_02(puzzle_input: List[str]) -> int:
     """Solve part two."""
 
-    sequences = parse(puzzle_input)
-    sequences = [seq[::-1] for seq in sequences]
+    return sum(extrapolate_all(values[:, ::-1]) for values in parsing.int_chunks(puzzle_input))
+
+
+def extrapolate_all(values) -> int:
+    """Return the sum of the next value of every row of the given 2D array.
+
+    The next value of a row is the sum of the last values of its diffs, so
+    every row is diffed at once until all of them are zero.
+    """
+
+    total = 0
 
-    results = map(extrapolate, sequences)
+    while values.shape[1] and values.any():
+        total += int(values[:, -1].sum())
+        values = values[:, 1:] - values[:, :-1]
 
-    return sum(results)
+    return total
 
 
-def parse(puzzle_input: List[str]) -> List[List[int]]:
-    """Parse the puzzle input."""
+def parse(puzzle_input: Iterable[str]) -> Iterator[List[int]]:
+    """Parse the puzzle input, one line at a time."""
 
-    return [list(map(int, line.strip().split())) for line in puzzle_input]
+    return (list(map(int, line.strip().split())) for line in puzzle_input)
 
 
 def extrapolate(values: List[int]) -> int:
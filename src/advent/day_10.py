@@ -5,7 +5,7 @@ import itertools
 import sys
 import time
 
-from typing import Dict, Iterator, List, Set
+from typing import Dict, Iterator, List, Set, Tuple
 
 
 Point = collections.namedtuple("Point", "x y")
@@ -79,15 +79,13 @@ TURNS = {
 }
 
 
-def part_01(puzzle_input: List[str]) -> int:
-    """Solve part one."""
+Prepared = Tuple[List[Cell], List[Cell]]
 
-    start_at, pipes, __ = parse(puzzle_input)
-    start_at, pipes = get_map(start_at, pipes)
 
-    first_move = PIPES[start_at.pipe][0]
+def part_01(puzzle_input: List[str], prepared: Prepared = None) -> int:
+    """Solve part one."""
 
-    loop = run_01(start_at, pipes, first_move)
+    pipes, loop = prepare(puzzle_input) if prepared is None else prepared
 
     n = len(loop)
 
@@ -97,9 +95,19 @@ def part_01(puzzle_input: List[str]) -> int:
         return (n + 1) // 2
 
 
-def part_02(puzzle_input: List[str]) -> int:
+def part_02(puzzle_input: List[str], prepared: Prepared = None) -> int:
     """Solve part two."""
 
+    pipes, loop = prepare(puzzle_input) if prepared is None else prepared
+
+    result = run_02(pipes, loop[:], flip=True)
+
+    return len(result)
+
+
+def prepare(puzzle_input: List[str]) -> Prepared:
+    """Return the cells of the puzzle, and the route of the loop."""
+
     start_at, pipes, __ = parse(puzzle_input)
     start_at, moves = get_map(start_at, pipes)
 
@@ -107,9 +115,7 @@ def part_02(puzzle_input: List[str]) -> int:
 
     loop = run_01(start_at, moves, first_move)
 
-    result = run_02(pipes, loop, flip=True)
-
-    return len(result)
+    return pipes, loop
 
 
 def parse(puzzle_input: List[str]) -> List[Cell]:
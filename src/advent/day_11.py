@@ -1,18 +1,11 @@
 """Advent of Code 2023, Day 11."""
 
-import collections
 import itertools
 import sys
 
 from typing import Dict, Iterator, List, Tuple
 
-
-class Point(collections.namedtuple("Point", "x y")):
-    def __lt__(self, other):
-        return (self.x < other.x) or (self.y < other.y)
-
-    def __gt__(self, other):
-        return (self.x > other.x) or (self.y > other.y)
+from advent.datatypes import Point
 
 
 def part_01(puzzle_input: List[str]) -> int:
@@ -7,6 +7,8 @@ import itertools
 
 from typing import Dict, List, Tuple
 
+from advent import cycles
+
 Point = collections.namedtuple("Point", ("x y"))
 
 
@@ -22,43 +24,30 @@ def part_01(puzzle_input: List[str]) -> int:
 def part_02(puzzle_input: List[str]) -> int:
     """Solve part two."""
 
-    grid = unpack(puzzle_input)
-
-    grids = dict()
-    loads = dict()
+    from advent import kernels
 
-    start, end = None, None
-    n = 1000000000
+    import numpy
 
-    for i in range(1, n + 1):
-        grid = spin(grid)
-        loads[i] = get_load(grid)
+    platform = kernels.Platform(kernels.from_lines(puzzle_input))
+    zobrist = kernels.Zobrist(platform.rocks.shape)
 
-        if grid in grids:
-            if start is None:
-                start = grids[grid]
-
-            if end is None:
-                end = i - 1
-                break
-        else:
-            grids[grid] = i
+    # The state carries its hash, which each spin updates by the cells that changed.
+    def step(state: Tuple) -> Tuple:
+        rocks, h = state
+        new = platform.spin(rocks)
 
-    d = end - start + 1
-    f = (n - end) // d
+        return new, zobrist.update(h, rocks, new)
 
-    r = start + (n - (end + (f * d) + 1))
+    def fingerprint(state: Tuple) -> int:
+        return state[1]
 
-    # Brute force answer check
-    # x = start
-    # while x < n:
-    #     x += d
-    # s = end - (x - n) + 1
+    def same(a: Tuple, b: Tuple) -> bool:
+        return numpy.array_equal(a[0], b[0])
 
-    # print(s)
-    # print(r)
+    start = platform.rocks, zobrist(platform.rocks)
+    rocks, __ = cycles.nth(step, start, 1000000000, fingerprint, same)
 
-    return loads[r]
+    return platform.load(rocks)
 
 
 def get_load(grid: List[str]) -> int:
@@ -3,7 +3,9 @@
 import collections
 import itertools
 
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+STREAMING = True
 
 
 def part_01(puzzle_input: List[str]) -> int:
@@ -56,13 +58,9 @@ def focusing_power(box_number: int, lenses: Dict[str, int]) -> int:
     return result
 
 
-def parse(puzzle_input: List[str]) -> List[str]:
-    result = []
-
+def parse(puzzle_input: Iterable[str]) -> Iterator[str]:
     for line in puzzle_input:
-        result.extend(line.split(","))
-
-    return result
+        yield from line.split(",")
 
 
 def unpack(chars: str) -> Tuple[str, str, int]:
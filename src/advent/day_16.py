@@ -7,17 +7,7 @@ import functools
 
 from typing import Iterator, List, Set, Tuple
 
-
-class Point(collections.namedtuple("Point", "x y")):
-    def __lt__(self, other: Point) -> bool:
-        return (self.x < other.x) or (self.y < other.y)
-
-    def __gt__(self, other: Point) -> bool:
-        return (self.x > other.x) or (self.y > other.y)
-
-    def __add__(self, other: Point) -> Point:
-        return Point(self.x + other.x, self.y + other.y)
-
+from advent.datatypes import Point
 
 Move = Tuple[Point, str]
 
@@ -131,21 +121,21 @@ MOVES = {
 }
 
 
-def part_01(puzzle_input: List[str]) -> int:
+def part_01(puzzle_input: List[str], prepared: Puzzle = None) -> int:
     """Solve part one."""
 
     start = Point(0, 0)
 
-    puzzle = parse(puzzle_input)
+    puzzle = parse(puzzle_input) if prepared is None else prepared
     x = puzzle.run(start, "E")
 
     return x
 
 
-def part_02(puzzle_input: List[str]) -> int:
+def part_02(puzzle_input: List[str], prepared: Puzzle = None) -> int:
     """Solve part two."""
 
-    puzzle = parse(puzzle_input)
+    puzzle = parse(puzzle_input) if prepared is None else prepared
 
     n = 0
 
@@ -156,6 +146,12 @@ def part_02(puzzle_input: List[str]) -> int:
     return n
 
 
+def prepare(puzzle_input: List[str]) -> Puzzle:
+    """Return the puzzle, shared by both parts so they share its beam cache."""
+
+    return parse(puzzle_input)
+
+
 def parse(puzzle_input: List[str]) -> Puzzle:
     result = {}
 
@@ -2,92 +2,97 @@
 
 from __future__ import annotations
 
-import functools
-import heapq
-import sys
+from typing import List
+from advent.datatypes import Grid
+from advent.graph import Graph, dijkstra
 
-from typing import Dict, List, Set
-from advent.datatypes import Point
+Maze = Grid
 
-Maze = Dict[Point, int]
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
 
-MOVES = {
-    "N": Point(0, -1),
-    "S": Point(0, +1),
-    "E": Point(+1, 0),
-    "W": Point(-1, 0),
-}
+# Moves along each axis; after moving along one axis, the crucible must turn onto the other.
+AXES = (
+    ((+1, 0), (-1, 0)),
+    ((0, +1), (0, -1)),
+)
 
 
-def part_01(puzzle_input: List[str]) -> int:
+def part_01(puzzle_input: List[str], prepared: Maze = None) -> int:
     """Solve part one."""
 
-    maze = parse(puzzle_input)
+    maze = parse(puzzle_input) if prepared is None else prepared
 
     return run(maze, 1, 3)
 
 
-def part_02(puzzle_input: List[str]) -> int:
+def part_02(puzzle_input: List[str], prepared: Maze = None) -> int:
     """Solve part two."""
 
-    maze = parse(puzzle_input)
+    maze = parse(puzzle_input) if prepared is None else prepared
 
     return run(maze, 4, 10)
 
 
+def prepare(puzzle_input: List[str]) -> Maze:
+    """Return the maze."""
+
+    return parse(puzzle_input)
+
+
 def parse(puzzle_input: List[str]) -> Maze:
-    return {
-        Point(x, y): int(col) for y, row in enumerate(puzzle_input) for x, col in enumerate(row)
-    }
+    return Grid.from_lines(puzzle_input, DIGITS)
 
 
 def run(maze: Maze, mn: int, mx: int) -> int:
-    s = min(maze)
-    e = max(maze)
+    graph = as_graph(maze, mn, mx)
+    sink = len(graph) - 1
+
+    return dijkstra(graph, [node(0, 0), node(0, 1)], target=sink)[sink]
 
-    result = sys.maxsize
-    seen = set()
 
-    pq = [
-        (0, s, MOVES["S"]),
-        (0, s, MOVES["E"]),
-    ]
+def node(i: int, axis: int) -> int:
+    """Return the node of arriving at cell i along the given axis."""
 
-    while pq:
-        h, p, d = heapq.heappop(pq)
+    return 2 * i + axis
 
-        if p == e:
-            result = h
-            break
 
-        if (p, d) in seen:
-            continue
+def as_graph(maze: Maze, mn: int, mx: int) -> Graph:
+    """Return the graph of (cell, axis) states, plus a sink after the last cell.
 
-        seen.add((p, d))
+    From each state the crucible turns onto the other axis, and moves mn to mx
+    cells; the weight of the edge is the heat lost on the way.
+    """
 
-        for m in moves(d):
-            q, y = p, h
+    w, h = maze.width, maze.height
+    cells = maze.cells
+    e = len(cells) - 1
+    sink = node(e + 1, 0)
 
-            for i in range(1, mx + 1):
-                q = ptoq(q, m)
+    def edges():
+        for i in range(len(cells)):
+            y0, x0 = divmod(i, w)
 
-                if q not in maze:
-                    continue
+            for axis in (0, 1):
+                turn = 1 - axis
 
-                y += maze[q]
+                for dx, dy in AXES[turn]:
+                    x, y, j, n = x0, y0, i, 0
+                    step = dy * w + dx
 
-                if i >= mn and (q, m) not in seen:
-                    heapq.heappush(pq, (y, q, m))
+                    for k in range(1, mx + 1):
+                        x += dx
+                        y += dy
 
-    return result
+                        if not (0 <= x < w and 0 <= y < h):
+                            break
 
+                        j += step
+                        n += cells[j]
 
-@functools.cache
-def moves(d: Point) -> Set[Point]:
-    b = Point(-d.x, -d.y)
-    return set(MOVES.values()) - {d, b}
+                        if k >= mn:
+                            yield node(i, axis), node(j, turn), n
 
+        yield node(e, 0), sink, 0
+        yield node(e, 1), sink, 0
 
-@functools.cache
-def ptoq(p: Point, m: Point) -> Point:
-    return Point(p.x + m.x, p.y + m.y)
+    return Graph.from_edges(sink + 1, edges())
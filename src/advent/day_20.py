@@ -2,11 +2,12 @@
 
 import collections
 import itertools
-import math
 import enum
 
 from typing import Dict, List
 
+from advent import cycles
+
 
 START = "broadcaster"
 
@@ -106,15 +107,15 @@ def part_02(puzzle_input: List[str]) -> int:
 
     modules = parse(puzzle_input)
 
-    cycles = []
+    periods = []
 
     for start in modules[START].outputs:
         subnet = get_subnet(puzzle_input, start)
 
-        cycle = unroll(subnet, end)
-        cycles.append(cycle)
+        period = unroll(subnet, end)
+        periods.append(period)
 
-    return math.prod(cycles)
+    return cycles.lcm(*periods)
 
 
 def parse(puzzle_input: List[str]) -> Dict[str, Module]:
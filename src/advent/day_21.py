@@ -1,13 +1,12 @@
 """Advent of Code 2023, Day 21."""
 
-import collections
 import functools
 import string
 import time
 
-from typing import Dict, List, Iterator, Set, Tuple
+from typing import List, Iterator, Set, Tuple
 
-from advent.datatypes import Point
+from advent.datatypes import Grid, Point, adjacent_many_ids, encode
 
 N = Point(+0, -1)
 E = Point(+1, +0)
@@ -16,6 +15,13 @@ W = Point(-1, +0)
 
 DIRS = frozenset({N, E, W, S})
 
+EMPTY = ord(".")
+ROCK = ord("#")
+START = ord("S")
+
+# Translation table that flags rocks with 1, and everything else with 0.
+IS_ROCK = bytes(int(c == ROCK) for c in range(256))
+
 
 def part_01(puzzle_input: List[str]) -> int:
     """Solve part one."""
@@ -64,78 +70,82 @@ def solve(puzzle_input: List[str], num: int) -> int:
     return Puzzle(puzzle).walk([num], s)[0]
 
 
-def parse(puzzle_input: List[str]) -> Tuple[Point, Dict[Point, str]]:
-    result = {}
+def parse(puzzle_input: List[str]) -> Tuple[Point, Grid]:
+    grid = Grid.from_lines(puzzle_input)
 
-    s = None
+    i = grid.find(START)
 
-    for y, line in enumerate(puzzle_input):
-        for x, char in enumerate(line):
-            p = Point(x, y)
+    if i < 0:
+        raise ValueError("The map has no start")
 
-            if char == "S":
-                s = p
-                char = "."
+    grid[i] = EMPTY
 
-            result[p] = char
-
-    return s, result
+    return grid.point(i), grid
 
 
 class Puzzle(object):
-    def __init__(self, puzzle: Dict[Point, str]):
-        self.puzzle = puzzle
-        self.rocks = {p for p, x in puzzle.items() if x == "#"}
-        self.mx = max(puzzle)
+    def __init__(self, grid: Grid):
+        self.grid = grid
 
     def __hash__(self):
         return id(self)
 
     def walk(self, steps: List[int], start: Point) -> List[int]:
-        result = []
+        """Return how many plots can be reached in exactly each number of steps.
 
-        x, y = start
-        visited = {start: 0}
-        d = 0
+        The walk runs on int ids over enough copies of the map around the
+        start that it never reaches the edge, so each step of the frontier is
+        one batch of offsets from the last, with no Point per neighbor.
+        """
 
-        queue = collections.deque()
-        queue.append(start)
+        grid = self.grid
+        n = max(steps)
 
-        for d in range(1, max(steps) + 1):
-            tmp = collections.deque()
+        tiles = 2 * (n // min(grid.width, grid.height) + 1) + 1
+        blocked, width = self.tiled(tiles)
 
-            while queue:
-                p = queue.popleft()
+        half = tiles // 2
+        s = encode(Point(start.x + half * grid.width, start.y + half * grid.height), width)
 
-                for m in (N, S, E, W):
-                    q = p + m
+        blocked[s] = 1
+        frontier = {s}
 
-                    if q in visited:
-                        continue
+        # Plots reached in an even and an odd number of steps.
+        counts = [1, 0]
+        result = []
+
+        for d in range(1, n + 1):
+            frontier = {i for i in adjacent_many_ids(frontier, width) if not blocked[i]}
 
-                    if self.is_empty(q):
-                        visited[q] = d
-                        tmp.append(q)
+            for i in frontier:
+                blocked[i] = 1
 
-            queue = tmp
+            counts[d % 2] += len(frontier)
 
             if d in steps:
-                result.append(sum((x % 2 == d % 2 for x in visited.values())))
+                result.append(counts[d % 2])
 
         return result
 
-    def is_empty(self, p: Point) -> bool:
-        q = self.wrap(p)
+    def tiled(self, tiles: int) -> Tuple[bytearray, int]:
+        """Return the map repeated tiles x tiles times, as a flag per cell that is set for rocks.
+
+        The cells are laid out as by `encode`, with the spare column of each row
+        blocked, and the width of the tiled map.
+        """
+
+        grid = self.grid
+        w = grid.width
 
-        return q not in self.rocks
+        flags = grid.cells.translate(IS_ROCK)
+        rows = [flags[y * w : (y + 1) * w] * tiles + b"\x01" for y in range(grid.height)]
 
-    def wrap(self, p: Point) -> Point:
-        return Point(p.x % (self.mx.x + 1), p.y % (self.mx.y + 1))
+        return bytearray(b"".join(rows) * tiles), w * tiles
 
 
-def pprint(puzzle: Dict[Point, str], points: Set[Point], start: Point):
-    mn = min(puzzle)
-    mx = max(puzzle)
+def pprint(puzzle: Grid, points: Set[Point], start: Point):
+    mn = Point(0, 0)
+    mx = Point(puzzle.width - 1, puzzle.height - 1)
 
     lines = []
 
@@ -152,7 +162,7 @@ def pprint(puzzle: Dict[Point, str], points: Set[Point], start: Point):
             elif p == start:
                 char = "$"
             else:
-                char = puzzle[p]
+                char = chr(puzzle.get(x, y))
 
             line.append(char)
 
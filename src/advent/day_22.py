@@ -7,15 +7,10 @@ import itertools
 
 from typing import Dict, Iterable, List, Set, Tuple
 
-Matrix = List[List[str]]
-
-
-class Point(collections.namedtuple("Point", "x,y,z")):
-    def __repr__(self) -> str:
-        return f"{self.x},{self.y},{self.z}"
+from advent import parsing
+from advent.datatypes import Point3 as Point
 
-    def __str__(self) -> str:
-        return repr(self)
+Matrix = List[List[str]]
 
 
 class Block(collections.namedtuple("Block", "name,start,end")):
@@ -45,22 +40,21 @@ class Block(collections.namedtuple("Block", "name,start,end")):
         )
 
 
-def part_01(puzzle_input: List[str]) -> int:
+Prepared = Tuple[List[Block], Set[str], Set[str]]
+
+
+def part_01(puzzle_input: List[str], prepared: Prepared = None) -> int:
     """Solve part one."""
 
-    blocks = parse(puzzle_input)
-    blocks = fall(blocks)
-    safe, unsafe = dust(blocks)
+    blocks, safe, unsafe = prepare(puzzle_input) if prepared is None else prepared
 
     return len(safe)
 
 
-def part_02(puzzle_input: List[str]) -> int:
+def part_02(puzzle_input: List[str], prepared: Prepared = None) -> int:
     """Solve part two."""
 
-    blocks = parse(puzzle_input)
-    blocks = fall(blocks)
-    safe, unsafe = dust(blocks)
+    blocks, safe, unsafe = prepare(puzzle_input) if prepared is None else prepared
 
     n = 0
 
@@ -71,6 +65,16 @@ def part_02(puzzle_input: List[str]) -> int:
     return n
 
 
+def prepare(puzzle_input: List[str]) -> Prepared:
+    """Return the settled blocks, and the blocks that are safe/unsafe to dust."""
+
+    blocks = parse(puzzle_input)
+    blocks = fall(blocks)
+    safe, unsafe = dust(blocks)
+
+    return blocks, safe, unsafe
+
+
 def parse(puzzle_input: List[str]) -> List[Block]:
     if len(puzzle_input) <= 26:
         names = string.ascii_uppercase
@@ -79,13 +83,8 @@ def parse(puzzle_input: List[str]) -> List[Block]:
 
     result = list()
 
-    for n, line in zip(names, puzzle_input):
-        s, e = line.split("~")
-
-        s = Point(*map(int, s.split(",")))
-        e = Point(*map(int, e.split(",")))
-
-        b = Block(str(n), s, e)
+    for n, row in zip(names, parsing.int_array(puzzle_input).tolist()):
+        b = Block(str(n), Point(*row[:3]), Point(*row[3:]))
         result.append(b)
 
     return result
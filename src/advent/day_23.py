@@ -1,13 +1,10 @@
 """Advent of Code 2023, Day 23."""
 
 import collections
-import itertools
-import networkx
-import time
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
-from advent.datatypes import Point
+from advent.datatypes import Point, decode, encode
 
 Maze = Dict[Point, str]
 DiGraph = Dict[Point, Dict[Point, int]]
@@ -24,6 +21,17 @@ MOVE = {
     "<": W,
 }
 
+# Worker processes for the part two search. The CLI sets it from --jobs when it
+# solves in the main process; solvers that already run in a pool leave it at 1.
+JOBS = 1
+
+# With jobs > 1, junction graphs at least this large are searched in parallel,
+# split DEPTH hops from the start. Each worker swaps its best length with the
+# others every SYNC nodes.
+PARALLEL = 24
+DEPTH = 6
+SYNC = 4096
+
 MOVES = {
     ">": ">^v",
     "^": "^<>",
@@ -35,24 +43,29 @@ MOVES = {
 def part_01(puzzle_input: List[str]) -> int:
     """Solve part one."""
 
-    return solve(puzzle_input, can_move_01)[0]
+    return solve_longest(puzzle_input, can_move_01)
 
 
 def part_02(puzzle_input: List[str]) -> int:
     """Solve part two."""
 
-    return solve(puzzle_input, can_move_02)[0]
+    return solve_longest(puzzle_input, can_move_02, JOBS)
 
 
 def solve(puzzle_input: List[str], can_move: callable) -> List[int]:
-    maze, start, end = parse(puzzle_input)
-    graph = as_digraph(maze, start, end, can_move)
+    __, weights = contract(puzzle_input, can_move)
 
-    answers = walk(graph, start, end)
+    answers = paths(Junctions.from_weights(weights))
 
     return answers
 
 
+def solve_longest(puzzle_input: List[str], can_move: callable, jobs: int = 1) -> int:
+    __, weights = contract(puzzle_input, can_move)
+
+    return longest_path(Junctions.from_weights(weights), jobs)
+
+
 def parse(puzzle_input: List[str]) -> Tuple[Maze, Point, Point]:
     result = {}
 
@@ -71,124 +84,365 @@ def parse(puzzle_input: List[str]) -> Tuple[Maze, Point, Point]:
     return result, start, end
 
 
+class Junctions(collections.namedtuple("Junctions", "edges bound source target offset")):
+    """Junction graph numbered with integer ids, for searches that keep the visited set in a bitmask.
+
+    Attributes:
+        edges (list[list[tuple[int, int]]]): (destination, weight) of the edges out of each node.
+        bound (list[int]): Heaviest edge into each node; no path gains more by entering it.
+        source (int): Id of the start.
+        target (int): Id of the node where every path to the end finishes.
+        offset (int): Length from the target to the end.
+    """
+
+    @classmethod
+    def from_digraph(cls, graph: DiGraph, start: Point, end: Point) -> "Junctions":
+        nodes = set(graph)
+
+        for edges in graph.values():
+            nodes.update(edges)
+
+        nodes = [start] + sorted(nodes - {start, end}) + [end]
+        ids = {p: i for i, p in enumerate(nodes)}
+
+        weights = [[0] * len(nodes) for __ in nodes]
+
+        for p, edges in graph.items():
+            for q, w in edges.items():
+                weights[ids[p]][ids[q]] = w
+
+        return cls.from_weights(weights)
+
+    @classmethod
+    def from_weights(cls, weights: List[List[int]]) -> "Junctions":
+        """Return the junction graph of a weight matrix, from the first node to the last.
+
+        weights[i][j] is the length of the edge from node i to node j, or 0 if
+        there is none.
+        """
+
+        n = len(weights)
+
+        edges = [[(v, w) for v, w in enumerate(row) if w] for row in weights]
+        bound = [max(column) for column in zip(*weights)]
+
+        target, offset = n - 1, 0
+
+        # If only one junction leads to the end, a path that reaches it must go straight
+        # to the end, since leaving it any other way would cut the end off.
+        into = [(u, row[target]) for u, row in enumerate(weights) if row[target]]
+
+        if len(into) == 1:
+            target, offset = into[0]
+
+        return cls(edges, bound, 0, target, offset)
+
+    def remaining(self, visited: int) -> int:
+        """Return the upper bound on the length left to walk through the unvisited nodes."""
+
+        return sum(b for i, b in enumerate(self.bound) if not visited >> i & 1)
+
+
 def walk(graph: DiGraph, start: Point, end: Point) -> List[int]:
+    """Return the distinct lengths of the simple paths from start to end, longest first."""
+
+    return paths(Junctions.from_digraph(graph, start, end))
+
+
+def paths(junctions: Junctions) -> List[int]:
+    """Return the distinct lengths of the simple paths from the source to the end, longest first."""
+
     result = set()
-    x = 0
 
-    digraph = networkx.DiGraph()
+    lengths(junctions, junctions.source, 1 << junctions.source, 0, result)
 
-    for src, edges in graph.items():
-        for dst, __ in edges.items():
-            digraph.add_edge(src, dst)
+    return sorted((n + junctions.offset for n in result), reverse=True)
 
-    paths = networkx.all_simple_paths(digraph, start, end)
 
-    st = time.time()
+def lengths(junctions: Junctions, u: int, visited: int, length: int, result: Set[int]) -> None:
+    """Add the lengths of the simple paths from u to the target to the result."""
 
-    for path in paths:
-        n = cost(path, graph)
+    if u == junctions.target:
+        result.add(length)
+        return
 
-        result.add(n)
+    for v, w in junctions.edges[u]:
+        if not visited >> v & 1:
+            lengths(junctions, v, visited | 1 << v, length + w, result)
 
-        if n > x:
-            x = n
-            # et = time.time() - st
-            # print(f"{et: >8.1f}s {len(path)}, {n}")
 
-    result = list(result)
-    result.sort(reverse=True)
+def longest(graph: DiGraph, start: Point, end: Point, jobs: int = 1) -> int:
+    """Return the length of the longest simple path from start to end."""
+
+    return longest_path(Junctions.from_digraph(graph, start, end), jobs)
 
-    return result
 
+def longest_path(junctions: Junctions, jobs: int = 1) -> int:
+    """Return the length of the longest simple path from the source to the end.
 
-def cost(path: List[Point], graph: DiGraph) -> int:
-    n = 0
+    With more than one job, graphs with at least PARALLEL junctions are
+    searched across that many worker processes. It's opt-in, so a solver
+    that already runs in a worker pool doesn't start a nested one.
+    """
 
-    for s, e in zip(path, path[1:]):
-        n += graph[s][e]
+    if jobs > 1 and len(junctions.edges) >= PARALLEL:
+        best = search_parallel(junctions, jobs)
+    else:
+        visited = 1 << junctions.source
+        best = search(junctions, junctions.source, visited, 0, junctions.remaining(visited), -1)
 
-    return n
+    if best < 0:
+        raise ValueError("No path from the start to the end")
 
+    return best + junctions.offset
 
-def _walk(graph: DiGraph, start: Point, end: Point) -> List[int]:
-    result = []
 
-    queue = collections.deque()
-    queue.append(((start,), 0))
+def search_parallel(junctions: Junctions, jobs: int, depth: int = DEPTH) -> int:
+    """Return the longest path to the target, searching the subtrees of each prefix in parallel.
 
-    # print()
-    while queue:
-        path, length = queue.popleft()
+    Every path of `depth` hops from the source is a prefix, and each worker
+    searches below one prefix at a time. The best length found so far is
+    shared between the workers while they search, so each prunes with the
+    longest path any of them has found.
+    """
 
-        p = path[-1]
+    import concurrent.futures
+    import multiprocessing
 
-        if p == end:
-            result.append(length)
-            continue
+    shared = multiprocessing.Value("q", -1)
 
-        for q, x in graph[p].items():
-            if q in path:
-                continue
+    starts = prefixes(junctions, depth)
+
+    # Search the most promising prefixes first, so the bound tightens early.
+    starts.sort(key=lambda prefix: prefix[2] + prefix[3], reverse=True)
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=share, initargs=(junctions, shared)
+    ) as executor:
+        for __ in executor.map(search_prefix, starts, chunksize=1):
+            pass
+
+    return shared.value
 
-            queue.append((path + (q,), length + x))
 
-    result.sort(reverse=True)
+def prefixes(junctions: Junctions, depth: int) -> List[Tuple[int, int, int, int]]:
+    """Return the (node, visited, length, remaining) states of the paths of `depth` hops.
+
+    Paths that reach the target in fewer hops are included where they stop.
+    """
+
+    visited = 1 << junctions.source
+    result = [(junctions.source, visited, 0, junctions.remaining(visited))]
+
+    for __ in range(depth):
+        queue, result = result, []
+
+        for u, visited, length, remaining in queue:
+            if u == junctions.target:
+                result.append((u, visited, length, remaining))
+                continue
+
+            for v, w in junctions.edges[u]:
+                if not visited >> v & 1:
+                    state = v, visited | 1 << v, length + w, remaining - junctions.bound[v]
+                    result.append(state)
 
     return result
 
 
-def as_digraph(maze: Maze, start: Point, end: Point, can_move: callable) -> DiGraph:
-    result = collections.defaultdict(dict)
-    route_ids = itertools.count()
+class SharedBest:
+    """The best length found so far, shared between worker processes.
 
-    queue = collections.deque()
-    queue.append((start, None, start, 0, "v", next(route_ids)))
+    Args:
+        value (multiprocessing.Value): Shared best length.
+        every (int): Number of `tick` calls between exchanges with the other workers.
+    """
 
-    seen = set()
+    def __init__(self, value, every: int = SYNC):
+        self.value = value
+        self.every = every
+        self.count = 0
 
-    # print()
+    def exchange(self, best: int) -> int:
+        """Publish the given length if it's the longest yet, and return the longest yet."""
 
-    while queue:
-        h, o, p, length, d, r = queue.popleft()
+        with self.value.get_lock():
+            if best > self.value.value:
+                self.value.value = best
 
-        tmp = []
+            return self.value.value
 
-        seen.add((d, p))
+    def tick(self, best: int) -> int:
+        """Return the longest length yet, exchanging it with the other workers every so often."""
 
-        for b, x in MOVE.items():
-            q = p + x
+        self.count += 1
 
-            if q not in maze:
-                continue
+        if self.count < self.every:
+            return best
 
-            if o == q:
-                continue
+        self.count = 0
 
-            if (b, q) in seen:
-                continue
+        return self.exchange(best)
 
-            if not can_move(b, p, q, maze):
-                continue
 
-            if is_intersection(q, maze):
-                result[h][q] = length + 1
-                # print(h, q, length + 1)
+_junctions = None
+_best = None
 
-                tmp.append([q, p, q, 0, b, r])
-            elif q == end:
-                result[h][q] = length + 1
-                # print(h, q, length + 1)
-            else:
-                tmp.append([h, p, q, length + 1, b, r])
 
-        for each in tmp[1:]:
-            each[-1] = next(route_ids)
+def share(junctions: Junctions, best) -> None:
+    """Keep the junction graph and the shared best length in a new worker process."""
 
-        queue.extend(tmp)
+    global _junctions, _best
+
+    _junctions, _best = junctions, SharedBest(best)
+
+
+def search_prefix(prefix: Tuple[int, int, int, int]) -> None:
+    """Search below the given prefix in a worker process, sharing longer paths as they're found."""
+
+    u, visited, length, remaining = prefix
+
+    search(_junctions, u, visited, length, remaining, _best.exchange(-1), _best)
+
+
+def search(
+    junctions: Junctions,
+    u: int,
+    visited: int,
+    length: int,
+    remaining: int,
+    best: int,
+    shared: SharedBest = None,
+) -> int:
+    """Return the longest path from u to the target, or the best so far if none is longer.
+
+    A branch is abandoned once its length plus the heaviest edges into every
+    unvisited node can't beat the best so far. With a shared best, longer
+    paths are published as soon as they're found, and the others' are picked
+    up every so often.
+    """
+
+    if u == junctions.target:
+        if shared is not None and length > best:
+            return shared.exchange(length)
+
+        return max(length, best)
+
+    if shared is not None:
+        best = shared.tick(best)
+
+    if length + remaining <= best:
+        return best
+
+    bound = junctions.bound
+
+    for v, w in junctions.edges[u]:
+        if not visited >> v & 1:
+            best = search(
+                junctions, v, visited | 1 << v, length + w, remaining - bound[v], best, shared
+            )
+
+    return best
+
+
+def as_digraph(maze: Maze, start: Point, end: Point, can_move: callable) -> DiGraph:
+    """Return the junction graph of the maze, as the length of the corridor between junctions.
+
+    The solvers work on `contract` directly; this renders the parsed maze back
+    into lines, and the matrix back into Points, for callers that want a graph.
+    """
+
+    width = max(p.x for p in maze) + 2
+    height = max(p.y for p in maze) + 1
+
+    lines = ["".join(maze.get(Point(x, y), "#") for x in range(width)) for y in range(height)]
+
+    nodes, weights = contract(lines, can_move)
+
+    result = {}
+
+    for p, row in zip(nodes, weights):
+        edges = {q: w for q, w in zip(nodes, row) if w}
+
+        if edges:
+            result[p] = edges
 
     return result
 
 
+def contract(puzzle_input: List[str], can_move: callable) -> Tuple[List[Point], List[List[int]]]:
+    """Return the junctions of the maze, and the matrix of corridor lengths between them.
+
+    The maze is read straight into a bytearray of cells, laid out as `encode`
+    numbers them but with a row of wall above and below, so every step from
+    an open cell lands inside it. Junctions are the start, the cells with at
+    least three open neighbors, and the end. Each corridor out of a junction
+    is followed until it reaches the next junction; weights[i][j] is the
+    longest such corridor from junction i to junction j, or 0 if there is
+    none. Nothing leaves the end, and nothing enters the start.
+
+    `can_move` is assumed to depend only on the direction and the cell moved into.
+    """
+
+    width = len(puzzle_input[0])
+    stride = width + 1
+
+    wall = ord("#")
+    edge = b"#" * stride
+
+    cells = bytearray(edge + b"".join(line.encode() + b"#" for line in puzzle_input) + edge)
+    steps = [(d, encode(MOVE[d], width)) for d in MOVE]
+    offsets = [o for __, o in steps]
+
+    # Directions that can't move into each kind of cell.
+    here = Point(0, 0)
+
+    blocked = {
+        (d, char)
+        for char in set(cells) - {wall}
+        for d in MOVE
+        if not can_move(d, here, here, {here: chr(char)})
+    }
+
+    source = stride + puzzle_input[0].index(".")
+    sink = stride + encode(Point(puzzle_input[-1].rindex("."), len(puzzle_input) - 1), width)
+
+    junctions = [source]
+
+    for i, char in enumerate(cells):
+        if char == wall or i == source or i == sink:
+            continue
+
+        if sum(cells[i + o] != wall for o in offsets) >= 3:
+            junctions.append(i)
+
+    junctions.append(sink)
+
+    ids = {i: n for n, i in enumerate(junctions)}
+    weights = [[0] * len(junctions) for __ in junctions]
+
+    for n, i in enumerate(junctions[:-1]):
+        for first in steps:
+            d, o = first
+            prev, cur, length = i, i + o, 1
+
+            while cells[cur] != wall and (d, cells[cur]) not in blocked and cur != source:
+                if cur in ids:
+                    m = ids[cur]
+                    weights[n][m] = max(weights[n][m], length)
+                    break
+
+                # A corridor cell has one way on, other than the way back.
+                for d, o in steps:
+                    if cur + o != prev and cells[cur + o] != wall:
+                        prev, cur, length = cur, cur + o, length + 1
+                        break
+                else:
+                    break
+
+    return [decode(i - stride, width) for i in junctions], weights
+
+
 def can_move_02(d: str, p: Point, q: Point, maze: Maze) -> bool:
     return True
 
@@ -204,10 +458,6 @@ def can_move_01(d: str, p: Point, q: Point, maze: Maze) -> bool:
         return b != x
 
 
-def is_intersection(p: Point, maze: Maze) -> bool:
-    return all([maze[a] != "." for a in p.adjacent() if a in maze])
-
-
 def pprint(route: List[Point], maze: Maze) -> None:
     mn = min(maze)
     mx = max(maze)
@@ -5,11 +5,13 @@ from __future__ import annotations
 import collections
 import itertools
 import math
-import numpy
 import sys
 
+from fractions import Fraction
+
 from typing import List, Optional, Tuple
-from z3 import *
+
+from advent import parsing
 
 INF = float("inf")
 
@@ -84,6 +86,154 @@ Particle = Tuple[Vector, Vector]
 
 VECTOR_INF = Vector.inf()
 
+# Number of pairs of hailstones tested at once, which bounds the size of the work arrays.
+CHUNK = 1 << 20
+
+# Relative rounding error allowed for a crossing computed in floats, before it is rechecked.
+EPSILON = 1e-9
+
+# Largest |position| * |velocity| for which the cross products fit in an int64.
+INT64_SAFE = 1 << 60
+
+
+class Hailstones(object):
+    """Hailstones as columns: positions and velocities are N x 3 int64 arrays."""
+
+    def __init__(self, positions, velocities):
+        self.positions = positions
+        self.velocities = velocities
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def parse(cls, puzzle_input: List[str]) -> Hailstones:
+        values = parsing.int_array(puzzle_input)
+
+        return cls(values[:, :3], values[:, 3:])
+
+    @classmethod
+    def from_particles(cls, particles: List[Particle]) -> Hailstones:
+        import numpy
+
+        values = numpy.array([tuple(p) + tuple(v) for p, v in particles], dtype=numpy.int64)
+        values = values.reshape(len(particles), 6)
+
+        return cls(values[:, :3], values[:, 3:])
+
+    def crossings(self, lo: Tuple[int, int], hi: Tuple[int, int], chunk: int = CHUNK) -> int:
+        """Return the number of pairs whose paths cross in the future, inside the XY box.
+
+        Each block of hailstones is tested against every later hailstone at once.
+        """
+
+        import numpy
+
+        n = len(self)
+        positions, velocities = self.positions[:, :2], self.velocities[:, :2]
+
+        if n and int(abs(positions).max()) * int(abs(velocities).max()) >= INT64_SAFE:
+            # The cross products would overflow, so do them with Python ints.
+            positions, velocities = positions.astype(object), velocities.astype(object)
+
+        px, py = positions[:, 0], positions[:, 1]
+        vx, vy = velocities[:, 0], velocities[:, 1]
+
+        rows = max(1, chunk // max(n, 1))
+        result = 0
+
+        for a in range(0, n - 1, rows):
+            b = min(a + rows, n - 1)
+
+            # Hailstones a..b-1 as a column, against every hailstone after a as a row.
+            later = numpy.arange(a + 1, n)[None, :] > numpy.arange(a, b)[:, None]
+
+            result += int(
+                count_crossings(
+                    (px[a:b, None], py[a:b, None], vx[a:b, None], vy[a:b, None]),
+                    (px[None, a + 1 :], py[None, a + 1 :], vx[None, a + 1 :], vy[None, a + 1 :]),
+                    later,
+                    lo,
+                    hi,
+                )
+            )
+
+        return result
+
+
+def count_crossings(a: tuple, b: tuple, mask, lo: Tuple[int, int], hi: Tuple[int, int]):
+    """Return how many of the masked pairs of hailstones cross in the future, inside the box.
+
+    The hailstones are given as (px, py, vx, vy) arrays that broadcast against
+    each other. The paths cross where pa + t * va = pb + s * vb. With
+    d = pb - pa, the cross products give det * t = d x vb and det * s = d x va,
+    where det = va x vb. These are exact integers, so parallel paths and
+    crossings in the past are rejected exactly.
+
+    The crossing point itself is computed in floats. Only crossings within
+    rounding distance of an edge of the box are checked again, exactly, as
+    lo * det <= pa * det + nt * va <= hi * det in Python ints.
+    """
+
+    import numpy
+
+    apx, apy, avx, avy = a
+    bpx, bpy, bvx, bvy = b
+
+    dx, dy = bpx - apx, bpy - apy
+
+    det = avx * bvy - avy * bvx
+    nt = dx * bvy - dy * bvx
+    ns = dx * avy - dy * avx
+
+    # Parallel paths never cross; both hailstones must reach the crossing after t = 0.
+    sign = numpy.where(det > 0, 1, -1)
+
+    ok = mask & (det != 0) & (nt * sign > 0) & (ns * sign > 0)
+
+    det, nt = det[ok], nt[ok]
+    apx, apy = numpy.broadcast_to(apx, ok.shape)[ok], numpy.broadcast_to(apy, ok.shape)[ok]
+    avx, avy = numpy.broadcast_to(avx, ok.shape)[ok], numpy.broadcast_to(avy, ok.shape)[ok]
+
+    t = nt.astype(float) / det
+
+    x = apx + t * avx
+    y = apy + t * avy
+
+    inside = (lo[0] <= x) & (x <= hi[0]) & (lo[1] <= y) & (y <= hi[1])
+
+    near = numpy.zeros(inside.shape, dtype=bool)
+
+    for value, edges in ((x, (lo[0], hi[0])), (y, (lo[1], hi[1]))):
+        margin = 1 + numpy.abs(value) * EPSILON
+
+        for edge in edges:
+            near |= numpy.abs(value - edge) <= margin
+
+    if near.any():
+        inside[near] = is_inside_exact(
+            tuple(numpy.asarray(v)[near].astype(object) for v in (apx, apy, avx, avy, nt, det)),
+            lo,
+            hi,
+        )
+
+    return inside.sum()
+
+
+def is_inside_exact(columns: tuple, lo: Tuple[int, int], hi: Tuple[int, int]):
+    """Return which crossings are inside the box, compared exactly with Python ints."""
+
+    apx, apy, avx, avy, nt, det = columns
+
+    # Multiply through by |det| so the comparison stays in integers.
+    sign = (det > 0) * 2 - 1
+    adet = det * sign
+
+    x = (apx * det + nt * avx) * sign
+    y = (apy * det + nt * avy) * sign
+
+    return (lo[0] * adet <= x) & (x <= hi[0] * adet) & (lo[1] * adet <= y) & (y <= hi[1] * adet)
+
 
 def approximately(a: float, b: float) -> bool:
     return math.isclose(a, b, rel_tol=1e-3)
@@ -92,14 +242,9 @@ def approximately(a: float, b: float) -> bool:
 def part_01(puzzle_input: List[str]) -> int:
     """Solve part one."""
 
-    particles = parse(puzzle_input, z=False)
-
-    bb = BoundingBox(
-        Vector(mn, mn, 0),
-        Vector(mx, mx, 0),
-    )
+    stones = Hailstones.parse(puzzle_input)
 
-    return solve_01(particles, bb)
+    return stones.crossings((mn, mn), (mx, mx))
 
 
 def part_02(puzzle_input: List[str]) -> int:
@@ -113,71 +258,113 @@ def part_02(puzzle_input: List[str]) -> int:
 
 
 def solve_01(particles: List[Particle], bb: BoundingBox) -> int:
-    result = 0
+    stones = Hailstones.from_particles(particles)
 
-    inf = Vector.inf()
+    return stones.crossings((bb.mn.x, bb.mn.y), (bb.mx.x, bb.mx.y))
 
-    for i, (ap, av) in enumerate(particles):
-        for j, (bp, bv) in enumerate(particles[i + 1 :], 1):
-            p = intersect(ap, av, bp, bv)
 
-            if p == inf:
-                continue
+def solve_02(particles: List[Particle]) -> Particle:
+    """Return the position and velocity of the rock that hits every hailstone.
 
-            if p not in bb:
-                continue
+    The rock hits hailstone i when P + t * V = p_i + t * v_i, so P - p_i and
+    V - v_i are parallel, and (P - p_i) x (V - v_i) = 0. The bilinear term
+    P x V is the same for every hailstone, so subtracting the equations of two
+    hailstones i and j leaves three linear equations:
 
-            a = intersect_at(ap, av, p)
-            b = intersect_at(bp, bv, p)
+        P x (v_j - v_i) + (p_j - p_i) x V = p_j x v_j - p_i x v_i
 
-            if (a, b) == (1, 1):
-                result += 1
+    Two pairs give six equations in six unknowns, which are solved exactly.
+    The first triple of hailstones that gives a single solution decides the
+    answer, which is then checked against every hailstone.
+    """
 
-    return result
+    for a, b, c in itertools.combinations(particles, 3):
+        matrix, rhs = [], []
 
+        for other in (b, c):
+            m, r = pair_equations(a, other)
+            matrix.extend(m)
+            rhs.extend(r)
 
-def solve_02(particles: List[Particle]) -> Particle:
-    n = len(particles)
-
-    p0, v0 = particles[0]
-    p1, v1 = particles[n // 2]
-    p2, v2 = particles[-1]
-
-    px, py, pz = Reals("px py pz")
-    vx, vy, vz = Reals("vx vy vz")
-    t0, t1, t2 = Reals("t0 t1 t2")
-    answer = Real("answer")
-
-    solver = Solver()
-    solver.add(
-        px + t0 * vx == p0.x + t0 * v0.x,
-        py + t0 * vy == p0.y + t0 * v0.y,
-        pz + t0 * vz == p0.z + t0 * v0.z,
-        px + t1 * vx == p1.x + t1 * v1.x,
-        py + t1 * vy == p1.y + t1 * v1.y,
-        pz + t1 * vz == p1.z + t1 * v1.z,
-        px + t2 * vx == p2.x + t2 * v2.x,
-        py + t2 * vy == p2.y + t2 * v2.y,
-        pz + t2 * vz == p2.z + t2 * v2.z,
-        answer == px + py + pz,
-    )
+        try:
+            solution = solve_linear(matrix, rhs)
+        except ValueError:
+            continue
 
-    solver.check()
-    m = solver.model()
+        p = Vector(*solution[:3])
+        v = Vector(*solution[3:])
 
-    p = Vector(
-        m[px].as_long(),
-        m[py].as_long(),
-        m[pz].as_long(),
-    )
+        # Any rock would have to be this one, so if it misses a hailstone there is none.
+        if not all(cross(p - hp, v - hv) == (0, 0, 0) for hp, hv in particles):
+            break
+
+        return as_vector(p), as_vector(v)
+
+    raise ValueError("No rock hits every hailstone")
+
+
+def pair_equations(a: Particle, b: Particle) -> Tuple[List[List[int]], List[int]]:
+    """Return the linear equations in (P, V) given by the hailstones a and b."""
+
+    (ap, av), (bp, bv) = a, b
 
-    v = Vector(
-        m[vx].as_long(),
-        m[vy].as_long(),
-        m[vz].as_long(),
+    # P x dv = -[dv] P and dp x V = [dp] V, for the cross product matrix [u] of u.
+    dv = skew(bv - av)
+    dp = skew(bp - ap)
+
+    matrix = [[-x for x in dv[i]] + dp[i] for i in range(3)]
+    rhs = [x - y for x, y in zip(cross(bp, bv), cross(ap, av))]
+
+    return matrix, rhs
+
+
+def solve_linear(matrix: List[List[int]], rhs: List[int]) -> List[Fraction]:
+    """Return x such that matrix * x = rhs, by Gaussian elimination over fractions.
+
+    Raises ValueError if the matrix is singular.
+    """
+
+    n = len(matrix)
+    rows = [[Fraction(x) for x in row] + [Fraction(r)] for row, r in zip(matrix, rhs)]
+
+    for col in range(n):
+        pivot = next((i for i in range(col, n) if rows[i][col]), None)
+
+        if pivot is None:
+            raise ValueError("Singular matrix")
+
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+
+        for i in range(n):
+            if i != col and rows[i][col]:
+                f = rows[i][col] / rows[col][col]
+                rows[i] = [x - f * y for x, y in zip(rows[i], rows[col])]
+
+    return [rows[i][n] / rows[i][i] for i in range(n)]
+
+
+def cross(a: Vector, b: Vector) -> Tuple:
+    return (
+        a.y * b.z - a.z * b.y,
+        a.z * b.x - a.x * b.z,
+        a.x * b.y - a.y * b.x,
     )
 
-    return p, v
+
+def skew(a: Vector) -> List[List[int]]:
+    """Return the matrix [a] such that [a] * b = a x b."""
+
+    return [
+        [0, -a.z, a.y],
+        [a.z, 0, -a.x],
+        [-a.y, a.x, 0],
+    ]
+
+
+def as_vector(v: Vector) -> Vector:
+    """Return the vector of fractions with its whole coordinates as ints."""
+
+    return Vector(*(int(x) if x.denominator == 1 else x for x in v))
 
 
 def as_int(v: Vector) -> Vector:
@@ -231,6 +418,8 @@ def normalize(v: Vector) -> Vector:
 
 
 def intersect_at(p: Vector, v: Vector, x: Vector) -> int:
+    import numpy
+
     if x == Vector(INF, INF, INF):
         return None
 
@@ -249,6 +438,8 @@ def intersect_at(p: Vector, v: Vector, x: Vector) -> int:
 
 
 def is_colinear(ap: Vector, av: Vector, bp: Vector, bv: Vector) -> bool:
+    import numpy
+
     result = False
 
     if Vector(*numpy.cross(av, bv)) == Vector.zero():
@@ -264,6 +455,8 @@ def is_colinear(ap: Vector, av: Vector, bp: Vector, bv: Vector) -> bool:
 
 
 def intersect(ap: Vector, av: Vector, bp: Vector, bv: Vector) -> Vector:
+    import numpy
+
     v1 = numpy.array(av).T
     c1 = numpy.array(ap).T
     v2 = numpy.array(bv).T
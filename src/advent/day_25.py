@@ -1,29 +1,109 @@
 """Advent of Code 2023, Day 25."""
 
+import array
 import collections
 import itertools
 import math
-import networkx
-import random
+import re
 
-from typing import Dict, FrozenSet, List, Set, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
 
+Node = str
+Nodes = Dict[Node, Set[Node]]
 
-class Edge(frozenset):
-    def __repr__(self) -> str:
-        return "/".join(sorted(self))
+# Names of one to three lowercase letters have a bijective base-26 code below
+# this, which indexes a flat table of ids. Any other name falls back to a dict.
+CODES = 26 + 26**2 + 26**3 + 1
+SHORT = re.compile(r"[a-z]{1,3}")
 
+A = ord("a") - 1
 
-Node = str
-Nodes = Dict[Node, Set[Node]]
+
+class Wiring(collections.namedtuple("Wiring", "names srcs dsts")):
+    """Components numbered with dense ids, and the wires between them as flat arrays.
+
+    Attributes:
+        names (list[str]): Name of each component, by id.
+        srcs (array.array): Id of the first component of each wire.
+        dsts (array.array): Id of the second component of each wire.
+    """
+
+    @classmethod
+    def parse(cls, puzzle_input: Iterable[str]) -> "Wiring":
+        """Return the wiring diagram, read in one pass over the lines."""
+
+        table = array.array("l", [-1]) * CODES
+        other = {}
+        names = []
+
+        srcs = array.array("l")
+        dsts = array.array("l")
+
+        def intern(name: str) -> int:
+            if SHORT.fullmatch(name):
+                code = 0
+
+                for c in name.encode("ascii"):
+                    code = code * 26 + c - A
+
+                i = table[code]
+
+                if i < 0:
+                    i = table[code] = len(names)
+                    names.append(name)
+            else:
+                i = other.get(name)
+
+                if i is None:
+                    i = other[name] = len(names)
+                    names.append(name)
+
+            return i
+
+        for line in puzzle_input:
+            a, __, bs = line.partition(": ")
+            u = intern(a)
+
+            for b in bs.split(" "):
+                srcs.append(u)
+                dsts.append(intern(b))
+
+        return cls(names, srcs, dsts)
+
+    @classmethod
+    def from_nodes(cls, nodes: Nodes) -> "Wiring":
+        """Return the wiring diagram of the given components."""
+
+        return cls.parse(f"{a}: {b}" for a in sorted(nodes) for b in sorted(nodes[a]) if a < b)
+
+    def as_graph(self):
+        """Return the wiring as an undirected graph, with one edge per wire."""
+
+        from advent.graph import Graph
+
+        edges = zip(self.srcs, self.dsts, itertools.repeat(1))
+
+        return Graph.from_edges(len(self.names), edges, directed=False)
+
+    def cut(self) -> Tuple[List[int], List[int]]:
+        """Return the ids of the two groups of components left by cutting three wires."""
+
+        from advent.graph import k_cut
+
+        result = k_cut(self.as_graph(), 3)
+
+        if result is None:
+            raise ValueError("No cut of three wires")
+
+        return result
 
 
 def part_01(puzzle_input: List[str]) -> int:
     """Solve part one."""
 
-    nodes = parse(puzzle_input)
+    wiring = Wiring.parse(puzzle_input)
 
-    return solve_01(nodes)
+    return math.prod(map(len, wiring.cut()))
 
 
 def part_02(puzzle_input: List[str]) -> int:
@@ -31,17 +111,7 @@ def part_02(puzzle_input: List[str]) -> int:
 
 
 def solve_01(nodes: Nodes) -> int:
-    graph = networkx.Graph()
-
-    for curr_node, next_nodes in nodes.items():
-        for next_node in next_nodes:
-            graph.add_edge(curr_node, next_node)
-
-    graph.remove_edges_from(networkx.minimum_edge_cut(graph))
-
-    subnets = networkx.connected_components(graph)
-
-    return math.prod(map(len, subnets))
+    return math.prod(map(len, min_cut(nodes)))
 
 
 def parse(puzzle_input: List[str]) -> Nodes:
@@ -58,15 +128,11 @@ def parse(puzzle_input: List[str]) -> Nodes:
 
 
 def min_cut(nodes: Nodes) -> List[Set[Node]]:
-    graph = networkx.Graph()
-
-    for curr_node, next_nodes in nodes.items():
-        for next_node in next_nodes:
-            graph.add_edge(curr_node, next_node)
+    """Return the two groups of components left by cutting three wires, smallest first."""
 
-    graph.remove_edges_from(networkx.minimum_edge_cut(graph))
+    wiring = Wiring.from_nodes(nodes)
 
-    result = [set(cc) for cc in networkx.connected_components(graph)]
+    result = [{wiring.names[i] for i in side} for side in wiring.cut()]
     result.sort(key=len)
 
     return result
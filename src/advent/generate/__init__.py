@@ -0,0 +1,67 @@
+"""Synthetic puzzle input generators.
+
+Each `advent.generate.day_NN` module has a `generate(scale, rng)` function
+that returns a puzzle input for that day, roughly `scale` times the size of
+an official input. The same seed always generates the same input.
+"""
+
+import importlib
+import math
+import os
+import pkgutil
+import random
+
+from typing import List
+
+import advent
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> List[str]:
+    """Return a synthetic puzzle input for the given day.
+
+    Args:
+        day (int): Day of the puzzle.
+        scale (float): Size of the input relative to an official input.
+        seed (int): Seed for the random number generator.
+
+    Returns:
+        list[str]
+    """
+
+    module = importlib.import_module(f"advent.generate.day_{day:02d}")
+
+    return module.generate(scale, random.Random(seed))
+
+
+def write(day: int, puzzle_input: List[str], source: str = "synthetic") -> str:
+    """Write the puzzle input to the data dir, and return its path."""
+
+    path = advent.get_puzzle_path(day, source)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "w") as fp:
+        fp.write("\n".join(puzzle_input))
+        fp.write("\n")
+
+    return path
+
+
+def days() -> List[int]:
+    """Return the days that have a generator."""
+
+    return sorted(
+        int(name[4:]) for __, name, __ in pkgutil.iter_modules(__path__) if name.startswith("day_")
+    )
+
+
+def scaled(n: int, scale: float) -> int:
+    """Return the count n scaled by the given factor."""
+
+    return max(1, round(n * scale))
+
+
+def scaled_side(n: int, scale: float) -> int:
+    """Return the side n of a square grid scaled so its area grows by the given factor."""
+
+    return max(1, round(n * math.sqrt(scale)))
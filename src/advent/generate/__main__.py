@@ -0,0 +1,34 @@
+"""Synthetic puzzle input generator script.
+
+Usage:
+    python -m advent.generate 5 14 22 --scale 10 --seed 1 --source synthetic
+"""
+
+import argparse
+
+import advent
+import advent.generate
+
+
+def main():
+    """Generate the puzzle inputs for the given days."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", type=str, nargs="*")
+    parser.add_argument("--scale", type=float, default=1, help="Size relative to a real input.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generator.")
+    parser.add_argument("-s", "--source", type=str, default="synthetic", help="Output data dir.")
+
+    args = parser.parse_args()
+
+    days = advent.parse_days(args.days) if args.days else advent.generate.days()
+
+    for day in days:
+        puzzle_input = advent.generate.generate(day, args.scale, args.seed)
+        path = advent.generate.write(day, puzzle_input, args.source)
+
+        print(f"Day {day:02d}: {len(puzzle_input)} lines in {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Synthetic input for Day 01."""
+
+import random
+import string
+
+from typing import List
+
+from advent.day_01 import NUMBERS
+from advent.generate import scaled
+
+WORDS = [NUMBERS[n] for n in range(1, 10)]
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return lines of letters, digits and spelled-out digits."""
+
+    return [line(rng) for __ in range(scaled(1000, scale))]
+
+
+def line(rng: random.Random) -> str:
+    parts = []
+
+    for __ in range(rng.randint(2, 8)):
+        r = rng.random()
+
+        if r < 0.3:
+            parts.append(rng.choice(string.digits[1:]))
+        elif r < 0.5:
+            parts.append(rng.choice(WORDS))
+        else:
+            parts.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))))
+
+    # Every line needs at least one digit for part one.
+    parts.insert(rng.randint(0, len(parts)), rng.choice(string.digits[1:]))
+
+    return "".join(parts)
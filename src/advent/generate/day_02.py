@@ -0,0 +1,26 @@
+"""Synthetic input for Day 02."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled
+
+COLORS = ("red", "green", "blue")
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return games of draws of colored cubes."""
+
+    result = []
+
+    for game_id in range(1, scaled(100, scale) + 1):
+        draws = []
+
+        for __ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 16)} {color}" for color in colors))
+
+        result.append(f"Game {game_id}: {'; '.join(draws)}")
+
+    return result
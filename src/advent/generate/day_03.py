@@ -0,0 +1,38 @@
+"""Synthetic input for Day 03."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled_side
+
+SYMBOLS = "*#+$/@%=&-"
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return an engine schematic of numbers and symbols."""
+
+    side = scaled_side(140, scale)
+
+    rows = [["."] * side for __ in range(side)]
+
+    for row in rows:
+        x = rng.randint(0, 4)
+
+        while x < side:
+            number = str(rng.randint(1, 999))
+
+            if x + len(number) > side:
+                break
+
+            row[x : x + len(number)] = number
+
+            x += len(number) + rng.randint(1, 8)
+
+    for __ in range(side * side // 20):
+        x, y = rng.randrange(side), rng.randrange(side)
+
+        if rows[y][x] == ".":
+            rows[y][x] = rng.choice(SYMBOLS)
+
+    return ["".join(row) for row in rows]
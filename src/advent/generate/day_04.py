@@ -0,0 +1,31 @@
+"""Synthetic input for Day 04."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return scratch cards of winning and drawn numbers."""
+
+    result = []
+
+    for card in range(1, scaled(200, scale) + 1):
+        numbers = rng.sample(range(1, 100), 35)
+
+        # Most cards win little, so the number of copies in part two stays reasonable.
+        matches = rng.choices(range(11), weights=(30, 15, 10, 8, 6, 5, 4, 3, 2, 1, 1))[0]
+
+        winning = numbers[:10]
+        drawing = winning[:matches] + numbers[10 : 35 - matches]
+        rng.shuffle(drawing)
+
+        result.append(
+            f"Card {card:>3}: "
+            f"{' '.join(f'{n:>2}' for n in winning)} | "
+            f"{' '.join(f'{n:>2}' for n in drawing)}"
+        )
+
+    return result
@@ -0,0 +1,58 @@
+"""Synthetic input for Day 05."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled
+
+STEPS = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+
+SPAN = 1 << 32
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return seed ranges, and maps that shuffle segments of the number line."""
+
+    num_seeds = 2 * scaled(10, scale)
+    num_ranges = scaled(30, scale)
+
+    seeds = []
+
+    for __ in range(num_seeds // 2):
+        start = rng.randrange(SPAN // 2)
+        seeds.extend([start, rng.randint(1, SPAN // 16)])
+
+    result = [f"seeds: {' '.join(map(str, seeds))}"]
+
+    for src, dst in zip(STEPS, STEPS[1:]):
+        result.append("")
+        result.append(f"{src}-to-{dst} map:")
+        result.extend(almanac_map(num_ranges, rng))
+
+    return result
+
+
+def almanac_map(num_ranges: int, rng: random.Random) -> List[str]:
+    """Return the lines of a map that permutes segments of [0, SPAN)."""
+
+    cuts = sorted(rng.sample(range(1, SPAN), num_ranges - 1))
+    bounds = [0] + cuts + [SPAN]
+
+    segments = list(zip(bounds, bounds[1:]))
+    shuffled = segments[:]
+    rng.shuffle(shuffled)
+
+    result = []
+    dst = 0
+
+    for src_start, src_end in shuffled:
+        n = src_end - src_start
+
+        # Leave some segments unmapped, so they map to themselves.
+        if rng.random() > 0.1:
+            result.append(f"{dst} {src_start} {n}")
+
+        dst += n
+
+    return result
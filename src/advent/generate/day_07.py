@@ -0,0 +1,17 @@
+"""Synthetic input for Day 07."""
+
+import random
+
+from typing import List
+
+from advent.day_07 import CARDS_01
+from advent.generate import scaled
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return hands of cards with their bids."""
+
+    return [
+        f"{''.join(rng.choices(CARDS_01, k=5))} {rng.randint(1, 1000)}"
+        for __ in range(scaled(1000, scale))
+    ]
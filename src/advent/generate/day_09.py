@@ -0,0 +1,25 @@
+"""Synthetic input for Day 09."""
+
+import math
+import random
+
+from typing import List
+
+from advent.generate import scaled
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return sequences sampled from integer polynomials."""
+
+    result = []
+
+    for __ in range(scaled(200, scale)):
+        degree = rng.randint(1, 8)
+        coeffs = [rng.randint(-10, 10) for __ in range(degree + 1)]
+
+        # Newton form, so every value is an integer and the diffs vanish after `degree` steps.
+        values = [sum(c * math.comb(x, k) for k, c in enumerate(coeffs)) for x in range(21)]
+
+        result.append(" ".join(map(str, values)))
+
+    return result
@@ -0,0 +1,170 @@
+"""Synthetic input for Day 10."""
+
+import random
+
+from typing import Dict, List, Set, Tuple
+
+from advent.generate import scaled_side
+
+Cell = Tuple[int, int]
+
+PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a field of pipes with one loop through the start tile.
+
+    The loop is the boundary of a random simply connected blob of cells,
+    drawn on a grid twice as fine so that it never touches itself.
+    """
+
+    side = scaled_side(70, scale)
+
+    blob = grow(side, rng)
+    loop = trace(blob)
+
+    size = 2 * side + 1
+    rows = [rng.choices(".|-LJ7F", weights=(30, 1, 1, 1, 1, 1, 1), k=size) for __ in range(size)]
+
+    for i, (x, y) in enumerate(loop):
+        prev, nxt = loop[i - 1], loop[(i + 1) % len(loop)]
+
+        rows[y][x] = PIPES[frozenset((heading((x, y), prev), heading((x, y), nxt)))]
+
+    # Start on a right-hand edge of the loop, so that the first move (north, for a "|")
+    # goes around it counter-clockwise, and make sure no stray pipes connect to it.
+    sx, sy = next((x, y) for i, (x, y) in enumerate(loop) if heading(loop[i - 1], (x, y)) == "S")
+    rows[sy][sx] = "S"
+
+    for x in (sx - 1, sx + 1):
+        if 0 <= x < size:
+            rows[sy][x] = "."
+
+    return ["".join(row) for row in rows]
+
+
+def grow(side: int, rng: random.Random) -> Set[Cell]:
+    """Return a random simply connected set of cells whose boundary never pinches."""
+
+    blob = {(side // 2, side // 2)}
+    frontier = list(adjacent(side // 2, side // 2, side))
+
+    target = side * side * 2 // 5
+
+    while len(blob) < target and frontier:
+        cell = frontier.pop(rng.randrange(len(frontier)))
+
+        if cell in blob:
+            continue
+
+        # Prefer cells that only touch the blob on one side, so it grows like a tree
+        # and the loop around it winds through most of the field, like the real one.
+        if sum(c in blob for c in adjacent(*cell, side)) > 1 and rng.random() < 0.95:
+            continue
+
+        blob.add(cell)
+        frontier.extend(c for c in adjacent(*cell, side) if c not in blob)
+
+    while True:
+        fill_holes(blob, side)
+
+        if not fix_pinches(blob):
+            break
+
+    return blob
+
+
+def adjacent(x: int, y: int, side: int) -> List[Cell]:
+    return [
+        (x + dx, y + dy)
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+        if 0 <= x + dx < side and 0 <= y + dy < side
+    ]
+
+
+def fill_holes(blob: Set[Cell], side: int) -> None:
+    """Add the cells that are enclosed by the blob to it."""
+
+    outside = set()
+    queue = [(-1, -1)]
+
+    while queue:
+        x, y = queue.pop()
+
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            c = (x + dx, y + dy)
+
+            if -1 <= c[0] <= side and -1 <= c[1] <= side and c not in outside and c not in blob:
+                outside.add(c)
+                queue.append(c)
+
+    for y in range(side):
+        for x in range(side):
+            if (x, y) not in outside:
+                blob.add((x, y))
+
+
+def fix_pinches(blob: Set[Cell]) -> bool:
+    """Fill in cells where the blob meets itself only at a corner; return True if any were."""
+
+    fixed = False
+
+    for x, y in list(blob):
+        for dx, dy in ((1, 1), (1, -1)):
+            a, b = (x + dx, y), (x, y + dy)
+
+            if (x + dx, y + dy) in blob and a not in blob and b not in blob:
+                blob.add(a)
+                fixed = True
+
+    return fixed
+
+
+def trace(blob: Set[Cell]) -> List[Cell]:
+    """Return the boundary of the blob as a loop of tiles on the doubled grid."""
+
+    edges: Dict[Cell, Cell] = {}
+
+    for x, y in blob:
+        # Corners of the cell, clockwise.
+        nw, ne, se, sw = (x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)
+
+        if (x, y - 1) not in blob:
+            edges[nw] = ne
+        if (x + 1, y) not in blob:
+            edges[ne] = se
+        if (x, y + 1) not in blob:
+            edges[se] = sw
+        if (x - 1, y) not in blob:
+            edges[sw] = nw
+
+    start = min(edges)
+    vertex = start
+
+    result = []
+
+    while True:
+        nxt = edges[vertex]
+
+        result.append((2 * vertex[0], 2 * vertex[1]))
+        result.append((vertex[0] + nxt[0], vertex[1] + nxt[1]))
+
+        vertex = nxt
+
+        if vertex == start:
+            break
+
+    return result
+
+
+def heading(a: Cell, b: Cell) -> str:
+    """Return the direction from tile a to the adjacent tile b."""
+
+    return {(0, -1): "N", (0, 1): "S", (1, 0): "E", (-1, 0): "W"}[(b[0] - a[0], b[1] - a[1])]
@@ -0,0 +1,31 @@
+"""Synthetic input for Day 11."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled_side
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return an image of galaxies with some empty rows and columns."""
+
+    side = scaled_side(140, scale)
+
+    empty_rows = set(rng.sample(range(side), side // 20))
+    empty_cols = set(rng.sample(range(side), side // 20))
+
+    result = []
+
+    for y in range(side):
+        row = []
+
+        for x in range(side):
+            if y in empty_rows or x in empty_cols:
+                row.append(".")
+            else:
+                row.append("#" if rng.random() < 0.022 else ".")
+
+        result.append("".join(row))
+
+    return result
@@ -0,0 +1,28 @@
+"""Synthetic input for Day 12."""
+
+import itertools
+import random
+
+from typing import List
+
+from advent.generate import scaled
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return rows of springs, partly unknown, with their damaged groups."""
+
+    result = []
+
+    for __ in range(scaled(1000, scale)):
+        springs = [rng.choice("#.") for __ in range(rng.randint(4, 20))]
+
+        if "#" not in springs:
+            springs[rng.randrange(len(springs))] = "#"
+
+        groups = [len(list(g)) for k, g in itertools.groupby(springs) if k == "#"]
+
+        masked = "".join("?" if rng.random() < 0.4 else s for s in springs)
+
+        result.append(f"{masked} {','.join(map(str, groups))}")
+
+    return result
@@ -0,0 +1,15 @@
+"""Synthetic input for Day 14."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled_side
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a platform of round rocks and cube rocks."""
+
+    side = scaled_side(100, scale)
+
+    return ["".join(rng.choices(".O#", weights=(65, 20, 15), k=side)) for __ in range(side)]
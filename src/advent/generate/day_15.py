@@ -0,0 +1,29 @@
+"""Synthetic input for Day 15."""
+
+import random
+import string
+
+from typing import List
+
+from advent.generate import scaled
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a single line of lens insert and remove steps."""
+
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for __ in range(scaled(500, scale))
+    ]
+
+    steps = []
+
+    for __ in range(scaled(4000, scale)):
+        label = rng.choice(labels)
+
+        if rng.random() < 0.7:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+
+    return [",".join(steps)]
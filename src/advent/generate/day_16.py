@@ -0,0 +1,18 @@
+"""Synthetic input for Day 16."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled_side
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a contraption of empty space, mirrors and splitters."""
+
+    side = scaled_side(110, scale)
+
+    return [
+        "".join(rng.choices(".\\/|-", weights=(90, 2.5, 2.5, 2.5, 2.5), k=side))
+        for __ in range(side)
+    ]
@@ -0,0 +1,15 @@
+"""Synthetic input for Day 17."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled_side
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a map of heat loss digits."""
+
+    side = scaled_side(141, scale)
+
+    return ["".join(rng.choices("123456789", k=side)) for __ in range(side)]
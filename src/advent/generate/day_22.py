@@ -0,0 +1,46 @@
+"""Synthetic input for Day 22."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled
+
+SIDE = 10
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a snapshot of falling bricks over a 10x10 area."""
+
+    num_bricks = scaled(1200, scale)
+    height = num_bricks // 3 + 2
+
+    filled = set()
+    result = []
+
+    while len(result) < num_bricks:
+        axis = rng.choices((0, 1, 2), weights=(45, 45, 10))[0]
+        size = rng.randint(1, 4 if axis < 2 else 3)
+
+        start = [rng.randrange(SIDE), rng.randrange(SIDE), rng.randint(1, height)]
+        end = start[:]
+        end[axis] += size - 1
+
+        if end[0] >= SIDE or end[1] >= SIDE:
+            continue
+
+        cells = {
+            (x, y, z)
+            for x in range(start[0], end[0] + 1)
+            for y in range(start[1], end[1] + 1)
+            for z in range(start[2], end[2] + 1)
+        }
+
+        if cells & filled:
+            continue
+
+        filled.update(cells)
+
+        result.append(f"{','.join(map(str, start))}~{','.join(map(str, end))}")
+
+    return result
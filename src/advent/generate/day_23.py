@@ -0,0 +1,71 @@
+"""Synthetic input for Day 23."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled_side
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a maze of corridors between a lattice of junctions.
+
+    Like the real input, every junction is surrounded by slopes that point
+    right or down, and the corridors between them vary in length. The search
+    in part two is exponential in the number of junctions, so scale gently.
+    """
+
+    n = max(2, scaled_side(6, scale))
+
+    xs = lattice(n, rng)
+    ys = lattice(n, rng)
+
+    width = xs[-1] + 2
+    height = ys[-1] + 3
+
+    rows = [["#"] * width for __ in range(height)]
+
+    # From the start on the top row down to the first junction.
+    for y in range(0, ys[0]):
+        rows[y][xs[0]] = "."
+    rows[ys[0] - 1][xs[0]] = "v"
+
+    # From the last junction down to the end on the bottom row.
+    for y in range(ys[-1] + 1, height):
+        rows[y][xs[-1]] = "."
+    rows[ys[-1] + 1][xs[-1]] = "v"
+
+    for j, y in enumerate(ys):
+        for i, x in enumerate(xs):
+            rows[y][x] = "."
+
+            if i + 1 < n:
+                corridor(rows, x, y, xs[i + 1], y, ">")
+
+            if j + 1 < n:
+                corridor(rows, x, y, x, ys[j + 1], "v")
+
+    return ["".join(row) for row in rows]
+
+
+def lattice(n: int, rng: random.Random) -> List[int]:
+    """Return n coordinates of junctions, with random gaps between them."""
+
+    result = [2]
+
+    for __ in range(n - 1):
+        result.append(result[-1] + rng.randint(8, 30))
+
+    return result
+
+
+def corridor(rows: List[List[str]], x0: int, y0: int, x1: int, y1: int, slope: str) -> None:
+    """Carve a straight corridor between two junctions, with slopes at both ends."""
+
+    cells = [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)][1:-1]
+
+    for x, y in cells:
+        rows[y][x] = "."
+
+    for x, y in (cells[0], cells[-1]):
+        rows[y][x] = slope
@@ -0,0 +1,33 @@
+"""Synthetic input for Day 24."""
+
+import random
+
+from typing import List
+
+from advent.generate import scaled
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return hailstones that are all hit by one rock, thrown at integer times."""
+
+    rock_p = [rng.randint(100, 300) * 10**12 for __ in range(3)]
+    rock_v = [rng.randint(-200, 200) for __ in range(3)]
+
+    result = []
+    times = set()
+
+    while len(result) < scaled(300, scale):
+        t = rng.randint(10**11, 10**12)
+
+        v = [rng.randint(-300, 300) for __ in range(3)]
+
+        if t in times or v == rock_v:
+            continue
+
+        times.add(t)
+
+        p = [rp + t * (rv - hv) for rp, rv, hv in zip(rock_p, rock_v, v)]
+
+        result.append(f"{', '.join(map(str, p))} @ {', '.join(map(str, v))}")
+
+    return result
@@ -0,0 +1,67 @@
+"""Synthetic input for Day 25."""
+
+import collections
+import random
+import string
+
+from typing import List
+
+from advent.generate import scaled
+
+
+def generate(scale: float, rng: random.Random) -> List[str]:
+    """Return a wiring diagram of two well-connected groups joined by exactly three wires."""
+
+    n = scaled(1500, scale)
+
+    names = component_names(n, rng)
+
+    split = rng.randint(n * 2 // 5, n * 3 // 5)
+    groups = names[:split], names[split:]
+
+    edges = set()
+
+    for group in groups:
+        # Each component wires to four random others, so the groups are
+        # 4-edge-connected and the planted cut is the only cut of three wires.
+        for a in group:
+            for b in rng.sample(group, 5):
+                if a != b and (b, a) not in edges:
+                    edges.add((a, b))
+
+    for __ in range(3):
+        while True:
+            edge = rng.choice(groups[0]), rng.choice(groups[1])
+
+            if edge not in edges:
+                edges.add(edge)
+                break
+
+    wires = collections.defaultdict(list)
+
+    for a, b in sorted(edges):
+        wires[a].append(b)
+
+    result = [f"{a}: {' '.join(bs)}" for a, bs in wires.items()]
+    rng.shuffle(result)
+
+    return result
+
+
+def component_names(n: int, rng: random.Random) -> List[str]:
+    """Return n unique component names, three letters long where possible."""
+
+    length = 3
+
+    while 26**length < 2 * n:
+        length += 1
+
+    result = set()
+
+    while len(result) < n:
+        result.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+
+    result = sorted(result)
+    rng.shuffle(result)
+
+    return result
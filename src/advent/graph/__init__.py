@@ -0,0 +1,19 @@
+"""Graphs stored as compressed sparse rows, and searches over them.
+
+Nodes are the ints 0..n-1. Days that search a map or a network build a
+`Graph` once, then share the same searches instead of walking dicts of dicts.
+"""
+
+from advent.graph.csr import Graph
+from advent.graph.mincut import k_cut, stoer_wagner
+from advent.graph.search import bfs, bfs01, connected_components, dijkstra
+
+__all__ = [
+    "Graph",
+    "bfs",
+    "bfs01",
+    "connected_components",
+    "dijkstra",
+    "k_cut",
+    "stoer_wagner",
+]
@@ -0,0 +1,102 @@
+"""Compressed sparse row graph."""
+
+from __future__ import annotations
+
+import array
+
+from typing import Iterable, Iterator, Tuple
+
+Edge = Tuple[int, int, int]
+
+
+class Graph(object):
+    """Weighted directed graph of n nodes, stored as compressed sparse rows.
+
+    The edges out of node u are `targets[offsets[u]:offsets[u + 1]]`, with the
+    matching `weights`. Undirected graphs store each edge in both directions.
+    """
+
+    __slots__ = ("offsets", "targets", "weights", "max_weight")
+
+    def __init__(self, offsets: array.array, targets: array.array, weights: array.array):
+        if len(targets) != len(weights) or offsets[-1] != len(targets):
+            raise ValueError("Offsets, targets and weights don't match")
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.max_weight = max(weights, default=0)
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[Edge], directed: bool = True) -> Graph:
+        """Return the graph of n nodes with the given (src, dst, weight) edges.
+
+        Args:
+            n (int): Number of nodes.
+            edges (iterable[tuple]): Edges as (src, dst, weight).
+            directed (bool): If False, add each edge in both directions.
+
+        Returns:
+            Graph
+        """
+
+        srcs = array.array("q")
+        dsts = array.array("q")
+        costs = array.array("q")
+
+        for src, dst, weight in edges:
+            srcs.append(src)
+            dsts.append(dst)
+            costs.append(weight)
+
+            if not directed:
+                srcs.append(dst)
+                dsts.append(src)
+                costs.append(weight)
+
+        # Counting sort of the edges by source node.
+        offsets = array.array("q", bytes(8 * (n + 1)))
+
+        for src in srcs:
+            offsets[src + 1] += 1
+
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        fill = offsets[:-1]
+        targets = array.array("q", bytes(8 * len(dsts)))
+        weights = array.array("q", bytes(8 * len(dsts)))
+
+        for src, dst, weight in zip(srcs, dsts, costs):
+            i = fill[src]
+            targets[i] = dst
+            weights[i] = weight
+            fill[src] = i + 1
+
+        return cls(offsets, targets, weights)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """Number of stored (directed) edges."""
+
+        return len(self.targets)
+
+    def degree(self, u: int) -> int:
+        """Return the number of edges out of node u."""
+
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbors(self, u: int) -> array.array:
+        """Return the targets of the edges out of node u."""
+
+        return self.targets[self.offsets[u] : self.offsets[u + 1]]
+
+    def edges(self, u: int) -> Iterator[Tuple[int, int]]:
+        """Yield the (target, weight) of each edge out of node u."""
+
+        a, b = self.offsets[u], self.offsets[u + 1]
+
+        return zip(self.targets[a:b], self.weights[a:b])
@@ -0,0 +1,193 @@
+"""Minimum edge cuts of undirected graphs.
+
+`stoer_wagner` finds a global minimum cut of a weighted graph. `k_cut` is
+the fast path for graphs known to have a cut of at most k edges: it counts
+edge-disjoint paths from a fixed source, and gives up on a target as soon as
+k + 1 paths are found, since then the two nodes are on the same side.
+"""
+
+import collections
+import heapq
+
+from typing import Dict, List, Optional, Tuple
+
+from advent.graph.csr import Graph
+from advent.graph.search import bfs
+
+Cut = Tuple[List[int], List[int]]
+
+
+def k_cut(graph: Graph, k: int, source: int = 0) -> Optional[Cut]:
+    """Return the two sides of a cut of at most k edges of an undirected graph, or None.
+
+    Every edge counts as one, whatever its weight. Targets are tried farthest
+    from the source first, as those are the most likely to be on the other side.
+
+    Args:
+        graph (Graph): Undirected graph, with each edge stored in both directions.
+        k (int): Largest number of edges in the cut.
+        source (int): Node on the first side of the cut.
+
+    Returns:
+        tuple[list[int], list[int]]: The nodes on the source's side, and the others.
+    """
+
+    n = len(graph)
+    reverse = reverse_edges(graph)
+    dist = bfs(graph, source)
+
+    for t in sorted(range(n), key=dist.__getitem__, reverse=True):
+        if t == source:
+            continue
+
+        side = separate(graph, reverse, source, t, k)
+
+        if side is not None:
+            inside = set(side)
+
+            return side, [u for u in range(n) if u not in inside]
+
+    return None
+
+
+def separate(graph: Graph, reverse: List[int], s: int, t: int, k: int) -> Optional[List[int]]:
+    """Return the nodes on s's side of a cut of at most k edges between s and t, or None.
+
+    Augments one unit of flow at a time along a shortest path in the residual
+    graph. If t can't be reached after at most k paths, the nodes reached from
+    s are one side of a cut of that many edges.
+    """
+
+    offsets, targets = graph.offsets, graph.targets
+
+    flow = [0] * graph.num_edges
+
+    for __ in range(k + 1):
+        parent = {s: -1}
+        queue = collections.deque([s])
+
+        while queue and t not in parent:
+            u = queue.popleft()
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+
+                if v not in parent and flow[i] < 1:
+                    parent[v] = i
+                    queue.append(v)
+
+        if t not in parent:
+            return sorted(parent)
+
+        # Push one unit along the path, from t back to s.
+        v = t
+
+        while v != s:
+            i = parent[v]
+            flow[i] += 1
+            flow[reverse[i]] -= 1
+            v = targets[reverse[i]]
+
+    return None
+
+
+def reverse_edges(graph: Graph) -> List[int]:
+    """Return the index of the opposite edge of each edge of an undirected graph."""
+
+    offsets, targets = graph.offsets, graph.targets
+
+    result = [-1] * graph.num_edges
+    unmatched = collections.defaultdict(list)
+
+    for u in range(len(graph)):
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            others = unmatched.get((v, u))
+
+            if others:
+                j = others.pop()
+                result[i], result[j] = j, i
+            else:
+                unmatched[u, v].append(i)
+
+    if any(unmatched.values()):
+        raise ValueError("Graph is not undirected")
+
+    return result
+
+
+def stoer_wagner(graph: Graph) -> Tuple[int, List[int]]:
+    """Return the weight of a global minimum cut of an undirected graph, and one side of it.
+
+    Each phase adds nodes in order of how strongly they connect to the nodes
+    already added. The last node's connection is a cut between it and the
+    rest, and the last two nodes are then merged.
+
+    Args:
+        graph (Graph): Undirected graph of at least two nodes, with each edge
+            stored in both directions.
+
+    Returns:
+        tuple[int, list[int]]
+    """
+
+    n = len(graph)
+
+    if n < 2:
+        raise ValueError("Graph must have at least two nodes")
+
+    adj: List[Dict[int, int]] = [collections.defaultdict(int) for __ in range(n)]
+
+    for u in range(n):
+        for v, w in graph.edges(u):
+            if u != v:
+                adj[u][v] += w
+
+    groups = [[u] for u in range(n)]
+    active = set(range(n))
+
+    best, best_side = None, None
+
+    while len(active) > 1:
+        start = next(iter(active))
+
+        added = set()
+        conn = collections.defaultdict(int)
+        heap = [(0, start)]
+        prev = last = None
+
+        while heap:
+            w, u = heapq.heappop(heap)
+
+            if u in added or -w != conn[u]:
+                continue
+
+            added.add(u)
+            prev, last = last, u
+
+            for v, x in adj[u].items():
+                if v not in added:
+                    conn[v] += x
+                    heapq.heappush(heap, (-conn[v], v))
+
+        if len(added) < len(active):
+            # The graph is disconnected, so the nodes reached are a cut of weight 0.
+            return 0, sorted(m for u in added for m in groups[u])
+
+        if best is None or conn[last] < best:
+            best, best_side = conn[last], sorted(groups[last])
+
+        # Merge the last node into the one added before it.
+        groups[prev].extend(groups[last])
+
+        for v, x in adj[last].items():
+            del adj[v][last]
+
+            if v != prev:
+                adj[prev][v] += x
+                adj[v][prev] += x
+
+        adj[last] = {}
+        active.remove(last)
+
+    return best, best_side
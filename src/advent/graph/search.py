@@ -0,0 +1,166 @@
+"""Searches over compressed sparse row graphs."""
+
+import collections
+
+from typing import Iterable, List, Union
+
+from advent.graph.csr import Graph
+
+UNREACHED = -1
+
+Sources = Union[int, Iterable[int]]
+
+
+def bfs(graph: Graph, sources: Sources) -> List[int]:
+    """Return the number of edges from the nearest source to each node, or -1 if unreachable."""
+
+    offsets, targets = graph.offsets, graph.targets
+
+    dist = [UNREACHED] * len(graph)
+    queue = collections.deque()
+
+    for s in as_sources(sources):
+        dist[s] = 0
+        queue.append(s)
+
+    while queue:
+        u = queue.popleft()
+        d = dist[u] + 1
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+
+            if dist[v] == UNREACHED:
+                dist[v] = d
+                queue.append(v)
+
+    return dist
+
+
+def bfs01(graph: Graph, sources: Sources) -> List[int]:
+    """Return the distance from the nearest source to each node, for edge weights of 0 or 1."""
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    dist = [UNREACHED] * len(graph)
+    queue = collections.deque()
+
+    for s in as_sources(sources):
+        dist[s] = 0
+        queue.append(s)
+
+    while queue:
+        u = queue.popleft()
+        d = dist[u]
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v, w = targets[i], weights[i]
+
+            if dist[v] == UNREACHED or d + w < dist[v]:
+                dist[v] = d + w
+
+                if w:
+                    queue.append(v)
+                else:
+                    queue.appendleft(v)
+
+    return dist
+
+
+def dijkstra(graph: Graph, sources: Sources, target: int = None) -> List[int]:
+    """Return the distance from the nearest source to each node, or -1 if unreachable.
+
+    Uses a bucket queue (Dial's algorithm): edge weights must be non-negative
+    ints, and a ring of max_weight + 1 buckets holds every pending distance.
+    If a target is given, the search stops once its distance is final.
+
+    Args:
+        graph (Graph): Graph to search.
+        sources (int | iterable[int]): Nodes at distance 0.
+        target (int): Node to stop at.
+
+    Returns:
+        list[int]
+    """
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    size = graph.max_weight + 1
+    buckets = [[] for __ in range(size)]
+
+    dist = [UNREACHED] * len(graph)
+    done = [False] * len(graph)
+    pending = 0
+
+    for s in as_sources(sources):
+        dist[s] = 0
+        buckets[0].append(s)
+        pending += 1
+
+    d = 0
+
+    while pending:
+        bucket = buckets[d % size]
+
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+
+            if done[u] or dist[u] != d:
+                continue
+
+            done[u] = True
+
+            if u == target:
+                return dist
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                n = d + weights[i]
+
+                if not done[v] and (dist[v] == UNREACHED or n < dist[v]):
+                    dist[v] = n
+                    buckets[n % size].append(v)
+                    pending += 1
+
+        d += 1
+
+    return dist
+
+
+def connected_components(graph: Graph) -> List[List[int]]:
+    """Return the nodes of each connected component of an undirected graph."""
+
+    offsets, targets = graph.offsets, graph.targets
+
+    seen = [False] * len(graph)
+    result = []
+
+    for s in range(len(graph)):
+        if seen[s]:
+            continue
+
+        seen[s] = True
+        component = [s]
+        stack = [s]
+
+        while stack:
+            u = stack.pop()
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+
+                if not seen[v]:
+                    seen[v] = True
+                    component.append(v)
+                    stack.append(v)
+
+        result.append(component)
+
+    return result
+
+
+def as_sources(sources: Sources) -> Iterable[int]:
+    """Return the given source node(s) as an iterable."""
+
+    return (sources,) if isinstance(sources, int) else sources
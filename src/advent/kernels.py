@@ -0,0 +1,220 @@
+"""Vectorized kernels for puzzles on character grids.
+
+Grids are 2D numpy arrays of uint8, one byte per cell, so a whole grid can
+be transformed, tilted and hashed without a Python loop over its cells.
+"""
+
+from __future__ import annotations
+
+import numpy
+
+from typing import Iterable, List, Tuple
+
+EMPTY = ord(".")
+ROCK = ord("O")
+WALL = ord("#")
+
+# Spin cycle order (see day 14).
+SPIN = "NWSE"
+
+
+def from_lines(lines: Iterable[str]) -> numpy.ndarray:
+    """Return the given lines as a grid of bytes."""
+
+    rows = [line.encode("ascii") for line in lines]
+
+    if len({len(row) for row in rows}) > 1:
+        raise ValueError("Rows of a grid must all have the same width")
+
+    return numpy.frombuffer(b"".join(rows), dtype=numpy.uint8).reshape(len(rows), -1).copy()
+
+
+def to_lines(grid: numpy.ndarray) -> List[str]:
+    """Return the grid as lines."""
+
+    return [row.tobytes().decode("ascii") for row in grid]
+
+
+def rotate_cw(grid: numpy.ndarray) -> numpy.ndarray:
+    """Return a view of the grid rotated 90 degrees clockwise."""
+
+    return grid[::-1].T
+
+
+def rotate_ccw(grid: numpy.ndarray) -> numpy.ndarray:
+    """Return a view of the grid rotated 90 degrees counterclockwise."""
+
+    return grid.T[::-1]
+
+
+def flip_h(grid: numpy.ndarray) -> numpy.ndarray:
+    """Return a view of the grid mirrored left to right."""
+
+    return grid[:, ::-1]
+
+
+def flip_v(grid: numpy.ndarray) -> numpy.ndarray:
+    """Return a view of the grid mirrored top to bottom."""
+
+    return grid[::-1]
+
+
+def tilt(
+    grid: numpy.ndarray,
+    direction: str,
+    rock: int = ROCK,
+    wall: int = WALL,
+    empty: int = EMPTY,
+) -> numpy.ndarray:
+    """Return a copy of the grid with every rock rolled as far as it goes in the given direction.
+
+    Args:
+        grid (numpy.ndarray): Grid of bytes.
+        direction (str): One of 'N', 'W', 'S', 'E'.
+        rock (int): Byte of a cell that rolls.
+        wall (int): Byte of a cell that stops rolling rocks.
+        empty (int): Byte of a cell that rocks roll through.
+
+    Returns:
+        numpy.ndarray
+    """
+
+    walls = grid == wall
+    segment, offset = segments(walls, direction)
+
+    counts = numpy.bincount(segment[grid == rock], minlength=segment.max() + 1)
+
+    result = numpy.full(grid.shape, empty, dtype=grid.dtype)
+    result[walls] = wall
+    result[offset < counts[segment]] = rock
+
+    return result
+
+
+def segments(walls: numpy.ndarray, direction: str) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Return the segment of each cell, and its distance from the segment's start.
+
+    Each row (or column) is split into segments by the walls; a segment starts
+    at the wall nearest to the cell in the given direction, or at the edge.
+    Walls get an offset past the end of any segment, so nothing rolls into them.
+    """
+
+    view = orient(walls, direction)
+    num_rows, num_cols = view.shape
+
+    cols = numpy.arange(num_cols)
+
+    # Segment ids are unique across rows: each row has at most num_cols + 1 segments.
+    segment = numpy.cumsum(view, axis=1) + (numpy.arange(num_rows) * (num_cols + 1))[:, None]
+
+    start = numpy.maximum.accumulate(numpy.where(view, cols, -1), axis=1) + 1
+    offset = numpy.where(view, num_cols + 1, cols - start)
+
+    return (
+        numpy.ascontiguousarray(orient(segment, direction, inverse=True)),
+        numpy.ascontiguousarray(orient(offset, direction, inverse=True)),
+    )
+
+
+def orient(grid: numpy.ndarray, direction: str, inverse: bool = False) -> numpy.ndarray:
+    """Return a view of the grid in which the given direction is west (towards column 0)."""
+
+    if direction == "W":
+        return grid
+    elif direction == "E":
+        return flip_h(grid)
+    elif direction == "N":
+        return grid.T
+    elif direction == "S":
+        return flip_v(grid.T) if inverse else flip_v(grid).T
+    else:
+        raise ValueError(f"Unknown direction {direction!r}")
+
+
+def spin(grid: numpy.ndarray, order: str = SPIN) -> numpy.ndarray:
+    """Return the grid tilted in each of the given directions in turn."""
+
+    for direction in order:
+        grid = tilt(grid, direction)
+
+    return grid
+
+
+class Platform(object):
+    """Fixed walls, with the segments for each direction computed once.
+
+    The rocks are a flat boolean mask, so a tilt is one bincount of the rocks
+    per segment and one comparison per cell.
+    """
+
+    def __init__(self, grid: numpy.ndarray, rock: int = ROCK, wall: int = WALL):
+        walls = grid == wall
+
+        self.shape = grid.shape
+        self.rocks = (grid == rock).ravel()
+        self.segments = {}
+
+        for direction in SPIN:
+            segment, offset = segments(walls, direction)
+            self.segments[direction] = segment.ravel(), offset.ravel(), int(segment.max()) + 1
+
+    def tilt(self, rocks: numpy.ndarray, direction: str) -> numpy.ndarray:
+        """Return the rocks rolled as far as they go in the given direction."""
+
+        segment, offset, size = self.segments[direction]
+        counts = numpy.bincount(segment[rocks], minlength=size)
+
+        return offset < counts[segment]
+
+    def spin(self, rocks: numpy.ndarray, order: str = SPIN) -> numpy.ndarray:
+        """Return the rocks tilted in each of the given directions in turn."""
+
+        for direction in order:
+            rocks = self.tilt(rocks, direction)
+
+        return rocks
+
+    def load(self, rocks: numpy.ndarray) -> int:
+        """Return the load of the given rocks on the north beams."""
+
+        return load(rocks.reshape(self.shape), rock=True)
+
+
+def load(grid: numpy.ndarray, rock: int = ROCK) -> int:
+    """Return the load on the north beams: each rock weighs its distance from the south edge."""
+
+    num_rows = grid.shape[0]
+
+    return int((grid == rock).sum(axis=1) @ numpy.arange(num_rows, 0, -1))
+
+
+class Zobrist(object):
+    """Zobrist hash of the set cells of a boolean mask.
+
+    Each cell has a random 64-bit key, and the hash of a mask is the XOR of the
+    keys of its set cells. Moving one cell updates the hash in O(1), and a
+    step that moves many cells updates it by the keys of the cells that changed.
+    """
+
+    def __init__(self, shape: tuple, seed: int = 0):
+        rng = numpy.random.default_rng(seed)
+
+        self.keys = rng.integers(0, 2**64, size=shape, dtype=numpy.uint64, endpoint=False)
+
+    def __call__(self, mask: numpy.ndarray) -> int:
+        return int(numpy.bitwise_xor.reduce(self.keys[mask], initial=numpy.uint64(0)))
+
+    def move(self, h: int, src: tuple, dst: tuple) -> int:
+        """Return the hash after moving a set cell from src to dst."""
+
+        return h ^ int(self.keys[src]) ^ int(self.keys[dst])
+
+    def update(self, h: int, old: numpy.ndarray, new: numpy.ndarray) -> int:
+        """Return the hash after the set cells changed from the old mask to the new one.
+
+        The same as a `move` for each cell that moved, done in one reduction.
+        """
+
+        changed = self.keys[old != new]
+
+        return h ^ int(numpy.bitwise_xor.reduce(changed, initial=numpy.uint64(0)))
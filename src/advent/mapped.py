@@ -0,0 +1,124 @@
+"""Memory-mapped puzzle input."""
+
+from __future__ import annotations
+
+import array
+import mmap
+
+from typing import Iterator, Tuple
+
+
+class MappedInput(object):
+    """Puzzle input read lazily from a memory-mapped file.
+
+    Iterating yields the lines as stripped strings, one at a time, so a
+    line-oriented solver can process an input of any size in constant memory.
+    Rows can also be accessed by index as zero-copy memoryviews; the line
+    offsets are only indexed on first use.
+
+    Views returned by `row` and `rows` must be released before the input is
+    closed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(path, "rb") as fp:
+            try:
+                self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped.
+                self._mm = None
+
+        self._offsets = None
+
+    def __enter__(self) -> MappedInput:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        for view in self.rows():
+            with view:
+                yield str(view, "utf-8").strip()
+
+    def __len__(self) -> int:
+        return len(self.offsets()) - 1
+
+    def __getitem__(self, i: int) -> memoryview:
+        return self.row(i)
+
+    def close(self):
+        """Unmap the file."""
+
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def offsets(self) -> array.array:
+        """Return the start offset of each row, followed by the start of the next row."""
+
+        if self._offsets is None:
+            offsets = array.array("Q")
+            end = -1
+
+            for start, end in self._lines():
+                offsets.append(start)
+
+            offsets.append(end + 1)
+
+            self._offsets = offsets
+
+        return self._offsets
+
+    def row(self, i: int) -> memoryview:
+        """Return row i (without the line ending) as a zero-copy view."""
+
+        offsets = self.offsets()
+        n = len(offsets) - 1
+
+        if i < 0:
+            i += n
+
+        if not 0 <= i < n:
+            raise IndexError(i)
+
+        start = offsets[i]
+        end = self._strip_cr(start, offsets[i + 1] - 1)
+
+        return memoryview(self._mm)[start:end]
+
+    def rows(self) -> Iterator[memoryview]:
+        """Yield each row (without the line ending) as a zero-copy view."""
+
+        for start, end in self._lines():
+            yield memoryview(self._mm)[start : self._strip_cr(start, end)]
+
+    def _lines(self) -> Iterator[Tuple[int, int]]:
+        """Yield the start offset of each row, and the offset of its newline."""
+
+        if self._mm is None:
+            return
+
+        mm = self._mm
+        size = len(mm)
+        start = 0
+
+        while start < size:
+            end = mm.find(b"\n", start)
+
+            if end == -1:
+                end = size
+
+            yield start, end
+
+            start = end + 1
+
+    def _strip_cr(self, start: int, end: int) -> int:
+        """Return the end of the row, excluding a trailing carriage return."""
+
+        if end > start and self._mm[end - 1] == ord("\r"):
+            end -= 1
+
+        return end
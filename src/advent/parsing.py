@@ -0,0 +1,88 @@
+"""Bulk parsing of the integers in puzzle inputs."""
+
+import itertools
+import re
+
+from typing import Iterable, Iterator, List
+
+INT = re.compile(r"-?\d+")
+
+NEWLINE = ord("\n")
+
+# Translation table that keeps digits and minus signs, and blanks everything else.
+NUMERIC = bytes(c if chr(c) in "-0123456789" else ord(" ") for c in range(256))
+
+
+def ints(line: str) -> List[int]:
+    """Return the integers in the given line."""
+
+    return list(map(int, INT.findall(line)))
+
+
+def int_array(lines: Iterable[str]):
+    """Return the integers in the given lines as a 2D numpy array, one row per line.
+
+    Every byte that isn't a digit or a minus sign is blanked with one
+    bytes.translate, and numpy parses the whole input in a single C-level pass,
+    so no Python object is made per value.
+
+    Args:
+        lines (iterable[str]): Lines with the same number of integers each.
+
+    Returns:
+        numpy.ndarray
+
+    Raises:
+        ValueError: If the lines don't all have the same number of integers.
+    """
+
+    import numpy
+
+    lines = list(lines)
+    num_rows = len(lines)
+
+    data = "\n".join(lines).encode("ascii")
+
+    # Each integer has exactly one run of digits, so count the runs on each line.
+    chars = numpy.frombuffer(data, dtype=numpy.uint8)
+    is_digit = (chars >= ord("0")) & (chars <= ord("9"))
+    starts = numpy.flatnonzero(is_digit & ~numpy.concatenate(([False], is_digit[:-1])))
+
+    newlines = numpy.flatnonzero(chars == NEWLINE)
+    counts = numpy.bincount(numpy.searchsorted(newlines, starts), minlength=num_rows)
+
+    num_cols = int(counts[0]) if num_rows else 0
+
+    if (counts != num_cols).any():
+        bad = int(numpy.argmax(counts != num_cols))
+        raise ValueError(f"Line {bad} has {counts[bad]} integers, expected {num_cols}")
+
+    # A minus sign that isn't followed by a digit is just punctuation.
+    text = data.translate(NUMERIC).replace(b"- ", b"  ")
+
+    if text.endswith(b"-"):
+        text = text[:-1]
+
+    values = numpy.fromstring(text, dtype=numpy.int64, sep=" ")
+
+    if len(values) != len(starts):
+        raise ValueError(f"Expected {len(starts)} integers, got {len(values)}")
+
+    return values.reshape(num_rows, num_cols)
+
+
+def int_chunks(lines: Iterable[str], size: int = 1 << 16) -> Iterator:
+    """Yield the integers in the given lines as 2D numpy arrays of up to `size` rows each.
+
+    Lets a streamed input be parsed in bulk, without holding all of it at once.
+    """
+
+    lines = iter(lines)
+
+    while True:
+        chunk = list(itertools.islice(lines, size))
+
+        if not chunk:
+            return
+
+        yield int_array(chunk)
@@ -0,0 +1,82 @@
+"""Profiling of puzzle solvers with cProfile and tracemalloc."""
+
+import contextlib
+import cProfile
+import os
+import pstats
+import tracemalloc
+
+from typing import Iterator, List, Tuple
+
+Row = Tuple[int, float, float, str]
+
+
+@contextlib.contextmanager
+def profile(name: str, out_dir: str, top: int = 10) -> Iterator[None]:
+    """Profile the enclosed block, then report the hot functions and peak memory.
+
+    Writes `<name>.prof` (load with pstats or snakeviz) and `<name>.snapshot`
+    (load with tracemalloc.Snapshot.load) to the output dir.
+
+    Args:
+        name (str): Name of the profiled phase (eg, 'day_14_part_02').
+        out_dir (str): Directory to write the profile and snapshot files to.
+        top (int): Number of hot functions to print.
+    """
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    profiler = cProfile.Profile()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        __, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        prof_path = os.path.join(out_dir, f"{name}.prof")
+        snapshot_path = os.path.join(out_dir, f"{name}.snapshot")
+
+        profiler.dump_stats(prof_path)
+        snapshot.dump(snapshot_path)
+
+        print(f"\t{name}: peak memory {peak / 2**20:.3f} MiB, profile in {prof_path}")
+        print(f"\t{'ncalls':>10} {'tottime':>9} {'cumtime':>9}  function")
+
+        for ncalls, tottime, cumtime, function in hot_functions(profiler, top):
+            print(f"\t{ncalls:>10} {tottime:>9.3f} {cumtime:>9.3f}  {function}")
+
+
+def hot_functions(profiler: cProfile.Profile, top: int = 10) -> List[Row]:
+    """Return the (ncalls, tottime, cumtime, function) of the slowest functions by own time."""
+
+    stats = pstats.Stats(profiler).stats
+
+    result = []
+
+    for (path, line, func), (__, ncalls, tottime, cumtime, __) in stats.items():
+        if path == "~":
+            function = func
+        else:
+            function = f"{func} ({os.path.basename(path)}:{line})"
+
+        result.append((ncalls, tottime, cumtime, function))
+
+    result.sort(key=lambda row: row[1], reverse=True)
+
+    return result[:top]
+
+
+def phase(out_dir: str, name: str, top: int = 10) -> contextlib.AbstractContextManager:
+    """Return a context that profiles the given phase, or does nothing if out_dir is None."""
+
+    if out_dir is None:
+        return contextlib.nullcontext()
+
+    return profile(name, out_dir, top)
@@ -1,5 +1,11 @@
 """Tests for the main functions."""
 
+import os
+import subprocess
+import sys
+
+import pytest
+
 import advent
 
 
@@ -14,3 +20,93 @@ def test_solve(test_source):
 
     assert answer_01.value == 2
     assert answer_02.value is True
+
+
+def test_solve_part(test_source):
+    answer = advent.solve_part(0, 1, test_source)
+
+    assert answer.value is None
+    assert answer.cpu >= 0
+
+
+def test_run_cached(tmp_path, monkeypatch):
+    import advent.cache
+
+    monkeypatch.setattr(advent, "CACHE_PATH", str(tmp_path / "cache.sqlite"))
+
+    key = advent.cache.Key(0, 1, "len", "abc", "def")
+
+    first = advent.run("Part 01", len, ["a", "b"], verbose=False, key=key)
+    second = advent.run("Part 01", len, ["a", "b"], verbose=False, key=key)
+
+    assert first.value == second.value == 2
+    assert not first.cached
+    assert second.cached
+
+
+def test_parse_days():
+    assert advent.parse_days(["1", "3,4", "6-8"]) == [1, 3, 4, 6, 7, 8]
+
+
+def test_clear_caches():
+    import advent.day_14
+
+    advent.day_14.roll(("O", ".", "O"))
+    advent.clear_caches(advent.day_14)
+
+    assert advent.day_14.roll.cache_info().currsize == 0
+
+
+def test_solve_prepared(test_source):
+    answer_01, answer_02 = advent.solve(
+        0,
+        lambda puzzle_input, prepared: prepared[0],
+        lambda puzzle_input, prepared: sum(prepared),
+        test_source,
+        prepare=lambda puzzle_input: [len(line) for line in puzzle_input],
+    )
+
+    assert answer_01.value == 5
+    assert answer_02.value == 10
+
+
+def test_map_puzzle_input(test_source):
+    with advent.map_puzzle_input(0, test_source) as puzzle_input:
+        assert list(puzzle_input) == ["hello", "world"]
+
+
+def test_solve_stream(test_source):
+    answer_01, answer_02 = advent.solve(0, len, bool, test_source, stream=True)
+
+    assert answer_01.value == 2
+    assert answer_02.value is True
+
+
+def test_heavy_imports_deferred():
+    code = (
+        "import sys, advent.day_23, advent.day_24, advent.day_25; "
+        "print(*sorted({'networkx', 'numpy', 'z3'} & set(sys.modules)))"
+    )
+
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(advent.__path__[0]))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize(
+    "modules",
+    [
+        {"advent.cache", "hashlib", "sqlite3"},
+        {"advent.profiling", "cProfile", "pstats", "tracemalloc"},
+    ],
+)
+def test_imported_lazily(modules):
+    code = f"import sys, advent.day_01; print(*sorted({modules!r} & set(sys.modules)))"
+
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(advent.__path__[0]))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
@@ -0,0 +1,97 @@
+"""Tests for the benchmark script."""
+
+import argparse
+import json
+
+import pytest
+
+import advent.benchmark
+import advent.day_14
+import advent.generate
+
+
+def test_summarize():
+    result = advent.benchmark.summarize([5, 1, 3, 2, 4])
+
+    assert result["samples"] == 5
+    assert result["min_ns"] == 1
+    assert result["median_ns"] == 3
+    assert result["p95_ns"] == 5
+    assert result["stddev_ns"] == pytest.approx(1.5811, rel=1e-3)
+
+
+@pytest.mark.parametrize(
+    "p,expected",
+    (
+        (0, 1),
+        (50, 5),
+        (95, 10),
+        (100, 10),
+    ),
+)
+def test_percentile(p, expected):
+    assert advent.benchmark.percentile(list(range(1, 11)), p) == expected
+
+
+def test_benchmark():
+    result = advent.benchmark.benchmark(advent.day_14.part_01, ["O.#", ".O.", "O.."], 1, 3)
+
+    assert result["samples"] == 3
+    assert result["value"] == 8
+    assert result["min_ns"] <= result["median_ns"] <= result["p95_ns"]
+
+
+@pytest.mark.parametrize(
+    "ys,expected",
+    (
+        ([10, 20, 40, 80], 1.0),
+        ([10, 40, 160, 640], 2.0),
+        ([10, 10, 10, 10], 0.0),
+    ),
+)
+def test_fit_exponent(ys, expected):
+    assert advent.benchmark.fit_exponent([1, 2, 4, 8], ys) == pytest.approx(expected)
+
+
+def test_compare():
+    baseline = [dict(day=1, part=1, exponent=1.0), dict(day=1, part=2, exponent=1.0)]
+    results = [dict(day=1, part=1, exponent=1.1), dict(day=1, part=2, exponent=2.0)]
+
+    assert advent.benchmark.compare(results, baseline, 0.25) == [(1, 2, 1.0, 2.0)]
+
+
+def test_scaling(monkeypatch):
+    # Each synthetic input is just its scale, and it takes scale ** 2 seconds to solve.
+    monkeypatch.setattr(advent.generate, "generate", lambda day, scale, seed: [scale])
+    monkeypatch.setattr(
+        advent.benchmark,
+        "benchmark",
+        lambda fn, puzzle_input, warmup, repeat: {"min_ns": puzzle_input[0] ** 2 * 1e9},
+    )
+
+    result = advent.benchmark.scaling(advent.day_14.part_01, 14, [1, 2, 4, 8], 0, 0, 1)
+
+    assert result["scales"] == [1, 2, 4, 8]
+    assert result["min_ns"] == [1e9, 4e9, 16e9, 64e9]
+    assert result["exponent"] == pytest.approx(2.0)
+
+
+def test_main_scaling_no_generator(capsys):
+    args = argparse.Namespace(
+        days=["8"],
+        size=1,
+        steps=1,
+        seed=0,
+        warmup=0,
+        repeat=1,
+        output=None,
+        baseline=None,
+        tolerance=0.25,
+    )
+
+    assert advent.benchmark.main_scaling(args) == 0
+
+    captured = capsys.readouterr()
+
+    assert "Day 08: no synthetic input generator" in captured.err
+    assert json.loads(captured.out)["scaling"] == []
@@ -0,0 +1,42 @@
+"""Tests for the answer cache."""
+
+import advent.cache
+import advent.day_01
+
+
+def test_make_key(tmp_path):
+    path = tmp_path / "day_01.txt"
+    path.write_text("1abc2\n")
+
+    input_hash = advent.cache.hash_file(str(path))
+
+    key = advent.cache.make_key(1, 1, advent.day_01.part_01, input_hash)
+
+    assert key.name == "part_01"
+    assert key.input_hash == input_hash
+    assert key.source_hash == advent.cache.hash_file(advent.day_01.__file__)
+
+
+def test_make_key_builtin():
+    assert advent.cache.make_key(0, 1, len, "abc") is None
+
+
+def test_store_and_lookup(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+
+    key = advent.cache.Key(1, 1, "part_01", "abc", "def")
+
+    assert advent.cache.lookup(path, key) is None
+
+    assert advent.cache.store(path, key, 142, 0.5, 0.25)
+    assert advent.cache.lookup(path, key) == (142, 0.5, 0.25)
+
+    assert advent.cache.lookup(path, key._replace(source_hash="xyz")) is None
+
+
+def test_store_unserializable(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+
+    key = advent.cache.Key(1, 1, "part_01", "abc", "def")
+
+    assert not advent.cache.store(path, key, object(), 0.5, 0.25)
@@ -0,0 +1,83 @@
+"""Tests for the cycle detection helpers."""
+
+import pytest
+
+import advent.cycles
+
+
+@pytest.mark.parametrize(
+    "mu,lam",
+    (
+        (0, 1),
+        (0, 7),
+        (3, 1),
+        (5, 12),
+        (100, 33),
+    ),
+)
+def test_brent(mu, lam):
+    def step(i):
+        i += 1
+        return mu + (i - mu) % lam if i >= mu + lam else i
+
+    assert advent.cycles.brent(step, 0) == (mu, lam)
+
+
+def test_brent_fingerprint():
+    # Only the last digit is part of the state.
+    def step(i):
+        return i + 3
+
+    assert advent.cycles.brent(step, 0, lambda i: i % 10) == (0, 10)
+
+
+def test_brent_same():
+    # The fingerprint collides for states 0 and 2, 1 and 3, and so on.
+    def step(i):
+        return (i + 1) % 7
+
+    assert advent.cycles.brent(step, 0, lambda i: i % 2) != (0, 7)
+    assert advent.cycles.brent(step, 0, lambda i: i % 2, lambda a, b: a == b) == (0, 7)
+
+
+def test_nth():
+    def step(i):
+        return (i * i + 1) % 255
+
+    expected = 0
+
+    for __ in range(1000):
+        expected = step(expected)
+
+    assert advent.cycles.nth(step, 0, 1000) == expected
+    assert advent.cycles.nth(step, 0, 2) == 2
+
+
+@pytest.mark.parametrize(
+    "periods,expected",
+    (
+        ((4,), 4),
+        ((4, 6), 12),
+        ((3, 5, 7), 105),
+        ((), 1),
+    ),
+)
+def test_lcm(periods, expected):
+    assert advent.cycles.lcm(*periods) == expected
+
+
+@pytest.mark.parametrize(
+    "residues,moduli,expected",
+    (
+        ((2, 3, 2), (3, 5, 7), (23, 105)),
+        ((0, 0), (4, 6), (0, 12)),
+        ((1, 3), (4, 6), (9, 12)),
+    ),
+)
+def test_crt(residues, moduli, expected):
+    assert advent.cycles.crt(residues, moduli) == expected
+
+
+def test_crt_no_solution():
+    with pytest.raises(ValueError):
+        advent.cycles.crt((0, 1), (4, 6))
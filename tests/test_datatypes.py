@@ -0,0 +1,106 @@
+"""Tests for the common data types."""
+
+import pytest
+
+import advent.datatypes
+
+from advent.datatypes import Grid, Point, Point3
+
+
+def test_point():
+    p = Point(1, 2)
+
+    assert p + Point(2, -1) == Point(3, 1)
+    assert p - Point(2, -1) == Point(-1, 3)
+    assert p + (1, 1) == Point(2, 3)
+    assert isinstance(p + (1, 1), Point)
+    assert not hasattr(p, "__dict__")
+
+
+def test_point3():
+    p = Point3(1, 2, 3)
+
+    assert p + Point3(1, 1, 1) == Point3(2, 3, 4)
+    assert p - Point3(1, 1, 1) == Point3(0, 1, 2)
+    assert str(p) == "<1,2,3>"
+    assert len(set(p.adjacent())) == 6
+    assert not hasattr(p, "__dict__")
+
+
+@pytest.fixture
+def grid():
+    return Grid.from_lines(["#.O", "##.", "..#"])
+
+
+def test_from_lines(grid):
+    assert grid.width == 3
+    assert grid.height == 3
+    assert len(grid) == 9
+    assert str(grid) == "#.O\n##.\n..#"
+
+
+def test_from_lines_table():
+    grid = Grid.from_lines(["12", "34"], bytes.maketrans(b"0123456789", bytes(range(10))))
+
+    assert list(grid.cells) == [1, 2, 3, 4]
+
+
+def test_from_lines_ragged():
+    with pytest.raises(ValueError):
+        Grid.from_lines(["..", "..."])
+
+
+def test_index(grid):
+    assert grid.index(2, 1) == 5
+    assert grid.point(5) == Point(2, 1)
+    assert grid[grid.index(2, 0)] == ord("O")
+
+
+def test_get(grid):
+    assert grid.get(0, 0) == ord("#")
+    assert grid.get(3, 0) is None
+    assert grid.get(0, -1, 0) == 0
+
+
+def test_copy(grid):
+    other = grid.copy()
+    other[0] = ord(".")
+
+    assert grid[0] == ord("#")
+
+
+def test_adjacent_table():
+    p = Point(3, 4)
+
+    assert [p + o for o in advent.datatypes.ADJACENT] == list(p.adjacent())
+
+
+@pytest.mark.parametrize("p", (Point(0, 0), Point(2, 0), Point(0, 2), Point(2, 2)))
+def test_encode(p):
+    assert advent.datatypes.decode(advent.datatypes.encode(p, 3), 3) == p
+
+
+def test_adjacent_offsets_do_not_wrap():
+    encode = advent.datatypes.encode
+    offsets = advent.datatypes.adjacent_offsets(3)
+
+    cells = {encode(Point(x, y), 3) for x in range(3) for y in range(3)}
+
+    right = encode(Point(2, 0), 3)
+    left = encode(Point(0, 1), 3)
+
+    assert {right + o for o in offsets} & cells == {
+        encode(Point(1, 0), 3),
+        encode(Point(2, 1), 3),
+    }
+    assert {left + o for o in offsets} & cells == {
+        encode(Point(1, 1), 3),
+        encode(Point(0, 0), 3),
+        encode(Point(0, 2), 3),
+    }
+
+
+def test_adjacent_many_ids():
+    ids = advent.datatypes.adjacent_many_ids({advent.datatypes.encode(Point(1, 1), 3)}, 3)
+
+    assert {advent.datatypes.decode(i, 3) for i in ids} == set(Point(1, 1).adjacent())
@@ -108,30 +108,46 @@ def test_parse_02(puzzle_input_02):
 
 
 def test_part_02_steps(puzzle_input_02):
-    __, tree = advent.day_08.parse(puzzle_input_02)
+    turns, tree = advent.day_08.parse(puzzle_input_02)
+
+    step = advent.day_08.stepper(turns, tree)
+
+    assert step(("11A", 0)) == ("11B", 1)
+    assert step(("11B", 1)) == ("11Z", 0)
+    assert step(("22C", 0)) == ("22Z", 1)
+
+
+def test_find_ends(puzzle_input_02):
+    turns, tree = advent.day_08.parse(puzzle_input_02)
 
-    ends = ["11Z", "22Z"]
+    step = advent.day_08.stepper(turns, tree)
 
-    old_nodes = [None, None]
-    new_nodes = ["11A", "22A"]
+    assert advent.day_08.find_ends(step, ("11A", 0)) == (1, 2, [2])
+    assert advent.day_08.find_ends(step, ("22A", 0)) == (1, 6, [3, 6])
 
-    old_nodes, new_nodes = advent.day_08.next_02(tree, "L", old_nodes, new_nodes)
-    assert new_nodes == ["11B", "22B"]
 
-    old_nodes, new_nodes = advent.day_08.next_02(tree, "R", old_nodes, new_nodes)
-    assert new_nodes == ["11Z", "22C"]
+def test_part_02_before_cycle():
+    puzzle_input = [
+        "L",
+        "",
+        "AAA = (AAZ, AAZ)",
+        "AAZ = (QQQ, QQQ)",
+        "QQQ = (QQQ, QQQ)",
+    ]
 
-    old_nodes, new_nodes = advent.day_08.next_02(tree, "L", old_nodes, new_nodes)
-    assert new_nodes == ["11B", "22Z"]
+    assert advent.day_08.part_02(puzzle_input) == 1
 
-    old_nodes, new_nodes = advent.day_08.next_02(tree, "R", old_nodes, new_nodes)
-    assert new_nodes == ["11Z", "22B"]
 
-    old_nodes, new_nodes = advent.day_08.next_02(tree, "L", old_nodes, new_nodes)
-    assert new_nodes == ["11B", "22C"]
+def test_part_02_never():
+    puzzle_input = [
+        "L",
+        "",
+        "AAA = (QQQ, QQQ)",
+        "QQQ = (QQQ, QQQ)",
+    ]
 
-    old_nodes, new_nodes = advent.day_08.next_02(tree, "R", old_nodes, new_nodes)
-    assert new_nodes == ["11Z", "22Z"]
+    with pytest.raises(ValueError):
+        advent.day_08.part_02(puzzle_input)
 
 
 def test_part_02(puzzle_input_02):
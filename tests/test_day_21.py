@@ -115,3 +115,17 @@ def test_part_02_examples(puzzle_input, n, expected):
     et = time.time()
 
     assert actual == expected
+
+
+def test_parse_no_start():
+    with pytest.raises(ValueError):
+        advent.day_21.parse(["...", ".#.", "..."])
+
+
+def test_tiled():
+    __, grid = advent.day_21.parse(["S#", ".."])
+
+    blocked, width = advent.day_21.Puzzle(grid).tiled(2)
+
+    assert width == 4
+    assert blocked == bytearray(b"\x00\x01\x00\x01\x01" b"\x00\x00\x00\x00\x01") * 2
@@ -120,3 +120,10 @@ def test_part_02(puzzle_input):
     answer = advent.day_22.part_02(puzzle_input)
 
     assert answer == 7
+
+
+def test_prepare(puzzle_input):
+    prepared = advent.day_22.prepare(puzzle_input)
+
+    assert advent.day_22.part_01(puzzle_input, prepared) == 5
+    assert advent.day_22.part_02(puzzle_input, prepared) == 7
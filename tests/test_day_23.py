@@ -88,3 +88,111 @@ def outputs(graph):
         result.extend(edges)
 
     return result
+
+
+def test_junctions(puzzle_input):
+    __, weights = advent.day_23.contract(puzzle_input, advent.day_23.can_move_02)
+    junctions = advent.day_23.Junctions.from_weights(weights)
+
+    # Only one junction leads to the end, so every path is forced through it.
+    assert junctions.offset > 0
+    assert junctions.edges[junctions.target]
+    assert junctions.remaining(1 << junctions.source) >= 154
+
+
+@pytest.mark.parametrize(
+    "can_move",
+    [
+        advent.day_23.can_move_01,
+        advent.day_23.can_move_02,
+    ],
+)
+def test_longest(puzzle_input, can_move):
+    maze, start, end = advent.day_23.parse(puzzle_input)
+
+    graph = advent.day_23.as_digraph(maze, start, end, can_move)
+
+    assert advent.day_23.longest(graph, start, end) == advent.day_23.walk(graph, start, end)[0]
+
+
+def test_prefixes(puzzle_input):
+    maze, start, end = advent.day_23.parse(puzzle_input)
+
+    graph = advent.day_23.as_digraph(maze, start, end, advent.day_23.can_move_02)
+    junctions = advent.day_23.Junctions.from_digraph(graph, start, end)
+
+    prefixes = advent.day_23.prefixes(junctions, 2)
+
+    assert prefixes
+    assert all(bin(visited).count("1") == 3 for __, visited, __, __ in prefixes)
+
+
+def test_longest_parallel(puzzle_input, monkeypatch):
+    monkeypatch.setattr(advent.day_23, "PARALLEL", 0)
+
+    maze, start, end = advent.day_23.parse(puzzle_input)
+
+    graph = advent.day_23.as_digraph(maze, start, end, advent.day_23.can_move_02)
+
+    assert advent.day_23.longest(graph, start, end, jobs=2) == 154
+
+
+def test_contract(puzzle_input):
+    nodes, weights = advent.day_23.contract(puzzle_input, advent.day_23.can_move_02)
+
+    assert nodes[0] == Point(1, 0)
+    assert nodes[-1] == Point(21, 22)
+    assert len(weights) == len(nodes) == 9
+
+    # Nothing leaves the end, and nothing enters the start.
+    assert not any(weights[-1])
+    assert not any(row[0] for row in weights)
+
+    assert max(weights[0]) == 15
+
+
+def test_longest_serial_by_default(puzzle_input, monkeypatch):
+    def search_parallel(*args, **kwargs):
+        raise AssertionError("Started a worker pool")
+
+    monkeypatch.setattr(advent.day_23, "PARALLEL", 0)
+    monkeypatch.setattr(advent.day_23, "search_parallel", search_parallel)
+
+    maze, start, end = advent.day_23.parse(puzzle_input)
+
+    graph = advent.day_23.as_digraph(maze, start, end, advent.day_23.can_move_02)
+
+    assert advent.day_23.longest(graph, start, end) == 154
+
+
+def test_search_shares_best(puzzle_input):
+    import multiprocessing
+
+    __, weights = advent.day_23.contract(puzzle_input, advent.day_23.can_move_02)
+    junctions = advent.day_23.Junctions.from_weights(weights)
+
+    visited = 1 << junctions.source
+    remaining = junctions.remaining(visited)
+
+    # Longer paths are published as they're found.
+    value = multiprocessing.Value("q", -1)
+    shared = advent.day_23.SharedBest(value, every=1)
+
+    advent.day_23.search(junctions, junctions.source, visited, 0, remaining, -1, shared)
+
+    assert value.value + junctions.offset == 154
+
+    # A longer path found by another worker is picked up mid-search, and prunes everything.
+    value = multiprocessing.Value("q", 1000)
+    shared = advent.day_23.SharedBest(value, every=1)
+
+    best = advent.day_23.search(junctions, junctions.source, visited, 0, remaining, -1, shared)
+
+    assert best == 1000
+
+
+def test_part_02_jobs(puzzle_input, monkeypatch):
+    monkeypatch.setattr(advent.day_23, "PARALLEL", 0)
+    monkeypatch.setattr(advent.day_23, "JOBS", 2)
+
+    assert advent.day_23.part_02(puzzle_input) == 154
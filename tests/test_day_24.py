@@ -3,6 +3,8 @@
 import pytest
 import math
 
+from fractions import Fraction
+
 import advent.day_24
 
 from advent.day_24 import BoundingBox, Vector
@@ -131,3 +133,65 @@ def test_part_02(puzzle_input):
     assert v == Vector(-3, 1, 2)
 
     assert sum(p) == 47
+
+
+def test_hailstones_parse(puzzle_input):
+    stones = advent.day_24.Hailstones.parse(puzzle_input)
+
+    assert len(stones) == 5
+    assert stones.positions[0].tolist() == [19, 13, 30]
+    assert stones.velocities[4].tolist() == [1, -5, -3]
+
+
+@pytest.mark.parametrize("chunk", (1, 4, 7, 1 << 20))
+def test_crossings(puzzle_input, chunk):
+    stones = advent.day_24.Hailstones.parse(puzzle_input)
+
+    assert stones.crossings((7, 7), (27, 27), chunk) == 2
+
+
+@pytest.mark.parametrize(
+    "lo, expected",
+    [
+        # The paths cross at y = 10**17 - 1/3, which rounds to 10**17 as a float.
+        (10**17, 0),
+        (10**17 - 1, 1),
+    ],
+)
+def test_crossings_exact(lo, expected):
+    stones = advent.day_24.Hailstones.parse(
+        [
+            "0, 0, 0 @ 3, 1, 0",
+            "299999999999999999, 0, 0 @ 0, 1, 0",
+        ]
+    )
+
+    assert stones.crossings((0, lo), (2**62, 2**62)) == expected
+
+
+def test_crossings_overflow():
+    stones = advent.day_24.Hailstones.parse(
+        [
+            "0, 0, 0 @ 3000000000, 1, 0",
+            "2999999999999999999, 0, 0 @ 0, 1000, 0",
+        ]
+    )
+
+    assert stones.crossings((0, 0), (2**63, 2**63)) == 1
+
+
+def test_part_02_no_rock(puzzle_input):
+    particles = advent.day_24.parse(puzzle_input, z=True)
+    particles.append((Vector(1, 2, 3), Vector(1, 1, 1)))
+
+    with pytest.raises(ValueError):
+        advent.day_24.solve_02(particles)
+
+
+def test_solve_linear():
+    x = advent.day_24.solve_linear([[2, 1], [1, 3]], [3, 5])
+
+    assert x == [Fraction(4, 5), Fraction(7, 5)]
+
+    with pytest.raises(ValueError):
+        advent.day_24.solve_linear([[1, 2], [2, 4]], [3, 6])
@@ -55,3 +55,34 @@ def test_part_01(puzzle_input):
     answer = advent.day_25.solve_01(nodes)
 
     assert answer == 54
+
+
+def test_wiring_parse(puzzle_input):
+    wiring = advent.day_25.Wiring.parse(puzzle_input)
+
+    assert len(wiring.names) == 15
+    assert len(wiring.srcs) == len(wiring.dsts) == 33
+    assert wiring.names[:4] == ["jqt", "rhn", "xhk", "nvd"]
+    assert list(wiring.dsts[:3]) == [1, 2, 3]
+
+
+def test_wiring_parse_long_names():
+    wiring = advent.day_25.Wiring.parse(["abcd: ab zzz", "ab: abcde"])
+
+    assert wiring.names == ["abcd", "ab", "zzz", "abcde"]
+    assert list(wiring.srcs) == [0, 0, 1]
+    assert list(wiring.dsts) == [1, 2, 3]
+
+
+def test_wiring_parse_other_names():
+    wiring = advent.day_25.Wiring.parse(["ba: a{ Ab", "a{: ba"])
+
+    assert wiring.names == ["ba", "a{", "Ab"]
+    assert list(wiring.srcs) == [0, 0, 1]
+    assert list(wiring.dsts) == [1, 2, 0]
+
+
+def test_wiring_part_01(puzzle_input):
+    answer = advent.day_25.part_01(puzzle_input)
+
+    assert answer == 54
@@ -0,0 +1,75 @@
+"""Tests for the synthetic input generators."""
+
+import importlib
+import math
+
+import pytest
+
+import advent.generate
+
+
+@pytest.mark.parametrize("day", advent.generate.days())
+def test_generate(day):
+    puzzle_input = advent.generate.generate(day, 0.05, seed=1)
+
+    assert puzzle_input == advent.generate.generate(day, 0.05, seed=1)
+    assert puzzle_input != advent.generate.generate(day, 0.05, seed=2)
+
+    module = importlib.import_module(f"advent.day_{day:02d}")
+
+    assert module.part_01(puzzle_input) is not None
+
+
+@pytest.mark.parametrize("day", (1, 14, 22))
+def test_scale(day):
+    small = advent.generate.generate(day, 1)
+    large = advent.generate.generate(day, 4)
+
+    assert sum(map(len, large)) == pytest.approx(4 * sum(map(len, small)), rel=0.1)
+
+
+def test_day_10():
+    import advent.day_10
+
+    puzzle_input = advent.generate.generate(10, 0.1, seed=3)
+
+    num_tiles = len(puzzle_input) * len(puzzle_input[0])
+
+    assert advent.day_10.part_01(puzzle_input) > 0
+    assert advent.day_10.part_02(puzzle_input) < num_tiles
+
+
+def test_day_24():
+    import advent.day_24
+
+    puzzle_input = advent.generate.generate(24, 0.02, seed=5)
+
+    assert advent.day_24.part_02(puzzle_input) % 10**12 == 0
+
+
+def test_day_25():
+    import advent.day_25
+
+    puzzle_input = advent.generate.generate(25, 0.1, seed=7)
+
+    nodes = advent.day_25.parse(puzzle_input)
+    a, b = advent.day_25.min_cut(nodes)
+
+    assert len(a) + len(b) == 150
+    assert advent.day_25.part_01(puzzle_input) == len(a) * len(b)
+
+
+def test_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(advent, "ROOT", str(tmp_path))
+
+    path = advent.generate.write(1, ["a1", "2b"], "synthetic")
+
+    assert path == str(tmp_path / "synthetic" / "day_01.txt")
+    assert advent.get_puzzle_input(1, "synthetic") == ["a1", "2b"]
+
+
+def test_scaled():
+    assert advent.generate.scaled(100, 0.5) == 50
+    assert advent.generate.scaled(100, 0.001) == 1
+    assert advent.generate.scaled_side(100, 4) == 200
+    assert advent.generate.scaled_side(100, 2) == round(100 * math.sqrt(2))
@@ -0,0 +1,112 @@
+"""Tests for the graph package."""
+
+import pytest
+
+import advent.graph
+
+from advent.graph import Graph
+
+UNREACHED = -1
+
+
+@pytest.fixture
+def graph():
+    # 0 -1- 1 -5- 3
+    # |           |
+    # 2 ----2---- +     4 -1- 5
+    return Graph.from_edges(
+        6,
+        [(0, 1, 1), (1, 3, 5), (0, 2, 1), (2, 3, 2), (4, 5, 1)],
+        directed=False,
+    )
+
+
+def test_from_edges(graph):
+    assert len(graph) == 6
+    assert graph.num_edges == 10
+    assert graph.max_weight == 5
+    assert sorted(graph.neighbors(0)) == [1, 2]
+    assert sorted(graph.edges(3)) == [(1, 5), (2, 2)]
+    assert graph.degree(5) == 1
+
+
+def test_from_edges_directed():
+    graph = Graph.from_edges(3, [(0, 1, 1), (1, 2, 1)])
+
+    assert list(graph.neighbors(1)) == [2]
+    assert list(graph.neighbors(2)) == []
+
+
+def test_bfs(graph):
+    assert advent.graph.bfs(graph, 0) == [0, 1, 1, 2, UNREACHED, UNREACHED]
+
+
+def test_bfs01():
+    graph = Graph.from_edges(4, [(0, 1, 1), (0, 2, 0), (2, 3, 0), (3, 1, 0)])
+
+    assert advent.graph.bfs01(graph, 0) == [0, 0, 0, 0]
+
+
+def test_dijkstra(graph):
+    assert advent.graph.dijkstra(graph, 0) == [0, 1, 1, 3, UNREACHED, UNREACHED]
+
+
+def test_dijkstra_sources(graph):
+    assert advent.graph.dijkstra(graph, [0, 4]) == [0, 1, 1, 3, 0, 1]
+
+
+def test_dijkstra_target(graph):
+    dist = advent.graph.dijkstra(graph, 0, target=2)
+
+    assert dist[2] == 1
+
+
+def test_connected_components(graph):
+    components = advent.graph.connected_components(graph)
+
+    assert sorted(map(sorted, components)) == [[0, 1, 2, 3], [4, 5]]
+
+
+@pytest.fixture
+def bridged():
+    # Two 4-cliques joined by the edges 3-4 and 2-5.
+    edges = []
+
+    for group in ([0, 1, 2, 3], [4, 5, 6, 7]):
+        edges.extend((a, b, 1) for i, a in enumerate(group) for b in group[i + 1 :])
+
+    edges.extend([(3, 4, 1), (2, 5, 1)])
+
+    return Graph.from_edges(8, edges, directed=False)
+
+
+def test_k_cut(bridged):
+    assert advent.graph.k_cut(bridged, 2) == ([0, 1, 2, 3], [4, 5, 6, 7])
+    assert advent.graph.k_cut(bridged, 2, source=6) == ([4, 5, 6, 7], [0, 1, 2, 3])
+
+
+def test_k_cut_none(bridged):
+    assert advent.graph.k_cut(bridged, 1) is None
+
+
+def test_stoer_wagner(bridged):
+    weight, side = advent.graph.stoer_wagner(bridged)
+
+    assert weight == 2
+    assert sorted(side) in ([0, 1, 2, 3], [4, 5, 6, 7])
+
+
+def test_stoer_wagner_weighted(graph):
+    weight, side = advent.graph.stoer_wagner(graph)
+
+    assert weight == 0
+    assert sorted(side) in ([0, 1, 2, 3], [4, 5])
+
+
+def test_stoer_wagner_connected():
+    connected = Graph.from_edges(4, [(0, 1, 1), (1, 3, 5), (0, 2, 1), (2, 3, 2)], directed=False)
+
+    weight, side = advent.graph.stoer_wagner(connected)
+
+    assert weight == 2
+    assert sorted(side) in ([0], [1, 2, 3])
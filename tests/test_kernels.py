@@ -0,0 +1,114 @@
+"""Tests for the grid kernels."""
+
+import numpy
+import pytest
+
+import advent.day_14
+import advent.kernels
+
+
+@pytest.fixture
+def puzzle_input():
+    return [
+        "O....#....",
+        "O.OO#....#",
+        ".....##...",
+        "OO.#O....O",
+        ".O.....O#.",
+        "O.#..O.#.#",
+        "..O..#O..O",
+        ".......O..",
+        "#....###..",
+        "#OO..#....",
+    ]
+
+
+def test_from_lines():
+    grid = advent.kernels.from_lines(["#.O", "##."])
+
+    assert grid.shape == (2, 3)
+    assert grid.dtype == numpy.uint8
+    assert advent.kernels.to_lines(grid) == ["#.O", "##."]
+
+
+def test_from_lines_ragged():
+    with pytest.raises(ValueError):
+        advent.kernels.from_lines(["..", "..."])
+
+
+@pytest.mark.parametrize(
+    "fn,expected",
+    (
+        (advent.kernels.rotate_cw, [".##", ".#.", "#.O"]),
+        (advent.kernels.rotate_ccw, ["O.#", ".#.", "##."]),
+        (advent.kernels.flip_h, ["O.#", ".##", "#.."]),
+        (advent.kernels.flip_v, ["..#", "##.", "#.O"]),
+    ),
+)
+def test_transform(fn, expected):
+    grid = advent.kernels.from_lines(["#.O", "##.", "..#"])
+
+    assert advent.kernels.to_lines(fn(grid)) == expected
+
+
+@pytest.mark.parametrize(
+    "direction,fn",
+    (
+        ("N", advent.day_14.tilt_n),
+        ("W", advent.day_14.tilt_w),
+        ("S", advent.day_14.tilt_s),
+        ("E", advent.day_14.tilt_e),
+    ),
+)
+def test_tilt(puzzle_input, direction, fn):
+    expected = advent.day_14.repack(fn(advent.day_14.unpack(puzzle_input)))
+
+    grid = advent.kernels.tilt(advent.kernels.from_lines(puzzle_input), direction)
+
+    assert advent.kernels.to_lines(grid) == expected
+
+
+def test_spin(puzzle_input):
+    expected = advent.day_14.repack(advent.day_14.spin(advent.day_14.unpack(puzzle_input)))
+
+    grid = advent.kernels.spin(advent.kernels.from_lines(puzzle_input))
+
+    assert advent.kernels.to_lines(grid) == expected
+
+
+def test_platform(puzzle_input):
+    grid = advent.kernels.from_lines(puzzle_input)
+    platform = advent.kernels.Platform(grid)
+
+    rocks = platform.spin(platform.rocks)
+    expected = advent.kernels.spin(grid) == advent.kernels.ROCK
+
+    assert numpy.array_equal(rocks.reshape(grid.shape), expected)
+    assert platform.load(platform.tilt(platform.rocks, "N")) == 136
+
+
+def test_load(puzzle_input):
+    grid = advent.kernels.tilt(advent.kernels.from_lines(puzzle_input), "N")
+
+    assert advent.kernels.load(grid) == 136
+
+
+def test_zobrist():
+    fingerprint = advent.kernels.Zobrist((2, 2))
+
+    a = numpy.array([[True, False], [False, False]])
+    b = numpy.array([[False, False], [False, True]])
+
+    assert fingerprint(a) != fingerprint(b)
+    assert fingerprint(a) == fingerprint(a.copy())
+    assert fingerprint.move(fingerprint(a), (0, 0), (1, 1)) == fingerprint(b)
+
+
+def test_zobrist_update():
+    fingerprint = advent.kernels.Zobrist((4,))
+
+    a = numpy.array([True, True, False, False])
+    b = numpy.array([False, True, False, True])
+
+    assert fingerprint.update(fingerprint(a), a, b) == fingerprint(b)
+    assert fingerprint.update(fingerprint(a), a, a) == fingerprint(a)
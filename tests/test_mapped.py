@@ -0,0 +1,49 @@
+"""Tests for the memory-mapped puzzle input."""
+
+import pytest
+
+from advent.mapped import MappedInput
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    (
+        (b"hello\nworld\n", ["hello", "world"]),
+        (b"hello\r\nworld", ["hello", "world"]),
+        (b"a\n\nb\n\n", ["a", "", "b", ""]),
+        (b"", []),
+    ),
+)
+def test_iter(tmp_path, data, expected):
+    path = tmp_path / "day_00.txt"
+    path.write_bytes(data)
+
+    with MappedInput(str(path)) as puzzle_input:
+        assert list(puzzle_input) == expected
+        assert list(puzzle_input) == expected, "Iterating twice should restart"
+        assert len(puzzle_input) == len(expected)
+
+
+def test_row(tmp_path):
+    path = tmp_path / "day_00.txt"
+    path.write_bytes(b"hello\r\nworld\n")
+
+    with MappedInput(str(path)) as puzzle_input:
+        with puzzle_input[0] as row:
+            assert row == b"hello"
+
+        with puzzle_input[-1] as row:
+            assert row == b"world"
+
+        with pytest.raises(IndexError):
+            puzzle_input[2]
+
+
+def test_rows(tmp_path):
+    path = tmp_path / "day_00.txt"
+    path.write_bytes(b"1 2\n3 4\n")
+
+    with MappedInput(str(path)) as puzzle_input:
+        rows = [bytes(row) for row in puzzle_input.rows()]
+
+    assert rows == [b"1 2", b"3 4"]
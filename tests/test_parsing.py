@@ -0,0 +1,47 @@
+"""Tests for the bulk integer parsing."""
+
+import numpy
+import pytest
+
+import advent.parsing
+
+
+def test_ints():
+    assert advent.parsing.ints("19, 13, 30 @ -2,  1, -2") == [19, 13, 30, -2, 1, -2]
+
+
+def test_int_array():
+    values = advent.parsing.int_array(["0 3 6 9", "-1 -2 -3 -4"])
+
+    assert values.dtype == numpy.int64
+    assert values.tolist() == [[0, 3, 6, 9], [-1, -2, -3, -4]]
+
+
+def test_int_array_punctuation():
+    values = advent.parsing.int_array(["19, 13, 30 @ -2,  1, -2", "1,0,1~1,2,1"])
+
+    assert values.tolist() == [[19, 13, 30, -2, 1, -2], [1, 0, 1, 1, 2, 1]]
+
+
+def test_int_array_minus():
+    values = advent.parsing.int_array(["seed-to-soil 1 -", "- 2-"])
+
+    assert values.tolist() == [[1], [2]]
+
+
+def test_int_array_ragged():
+    with pytest.raises(ValueError):
+        advent.parsing.int_array(["1 2 3", "4 5"])
+
+
+def test_int_array_empty():
+    assert advent.parsing.int_array([]).shape == (0, 0)
+
+
+def test_int_chunks():
+    lines = [f"{i} {i * 2}" for i in range(10)]
+
+    chunks = list(advent.parsing.int_chunks(lines, 4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert numpy.concatenate(chunks).tolist() == [[i, i * 2] for i in range(10)]
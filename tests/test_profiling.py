@@ -0,0 +1,47 @@
+"""Tests for the profiling hooks."""
+
+import cProfile
+
+import advent.day_14
+import advent.profiling
+
+
+def test_profile(tmp_path, capsys):
+    with advent.profiling.profile("day_14_part_01", str(tmp_path), top=3):
+        advent.day_14.part_01(["O.#", ".O.", "O.."])
+
+    assert (tmp_path / "day_14_part_01.prof").exists()
+    assert (tmp_path / "day_14_part_01.snapshot").exists()
+
+    out = capsys.readouterr().out
+
+    assert "peak memory" in out
+    assert len(out.strip().splitlines()) == 5
+
+
+def test_hot_functions():
+    profiler = cProfile.Profile()
+    profiler.runcall(advent.day_14.part_01, ["O.#", ".O.", "O.."])
+
+    rows = advent.profiling.hot_functions(profiler, top=2)
+
+    assert len(rows) == 2
+    assert rows[0][1] >= rows[1][1]
+
+
+def test_phase(tmp_path, capsys):
+    with advent.profiling.phase(str(tmp_path), "day_00_part_01", top=1):
+        pass
+
+    assert (tmp_path / "day_00_part_01.prof").exists()
+    assert "day_00_part_01" in capsys.readouterr().out
+
+
+def test_phase_disabled(tmp_path, capsys, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with advent.profiling.phase(None, "day_00_part_01"):
+        pass
+
+    assert not list(tmp_path.iterdir())
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,72 @@
+"""Tests for the puzzle server."""
+
+import os
+import threading
+
+import pytest
+
+import advent.serve
+
+PUZZLE_INPUT = [
+    "O....#....",
+    "O.OO#....#",
+    ".....##...",
+    "OO.#O....O",
+    ".O.....O#.",
+    "O.#..O.#.#",
+    "..O..#O..O",
+    ".......O..",
+    "#....###..",
+    "#OO..#....",
+]
+
+
+@pytest.fixture()
+def socket_path(tmp_path):
+    path = str(tmp_path / "advent.sock")
+
+    server = advent.serve.make_server(path, [14], jobs=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield path
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_request(socket_path):
+    response = advent.serve.request(socket_path, 14, 1, PUZZLE_INPUT)
+
+    assert response["day"] == 14
+    assert response["part"] == 1
+    assert response["value"] == 136
+    assert response["latency"] >= response["time"] >= 0
+
+
+def test_request_text(socket_path):
+    for __ in range(2):
+        response = advent.serve.request(socket_path, 14, 2, "\n".join(PUZZLE_INPUT) + "\n")
+
+        assert response["value"] == 64
+
+
+def test_request_error(socket_path):
+    response = advent.serve.request(socket_path, 14, 3, PUZZLE_INPUT)
+
+    assert "error" in response
+
+
+def test_server_close(tmp_path):
+    path = str(tmp_path / "advent.sock")
+
+    server = advent.serve.make_server(path, [], jobs=1)
+    server.server_close()
+
+    assert not os.path.exists(path)
+
+
+def test_as_lines():
+    assert advent.serve.as_lines("a \nb\r\n") == ["a", "b"]
+    assert advent.serve.as_lines(["a\n", "b"]) == ["a", "b"]